@@ -5,7 +5,7 @@ This module wires together configuration, DB pool, and parser settings for the b
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from psycopg_pool import AsyncConnectionPool
 
@@ -13,21 +13,36 @@ from src.config.settings import Settings
 from src.db.pool import create_pool
 
 
-@dataclass(frozen=True)
-class App:
-    """Shared application dependencies for handlers."""
+class App(NamedTuple):
+    """Shared application dependencies for handlers.
+
+    Settings read on every message are copied to top-level fields so the handler hot path uses
+    plain tuple-field lookups instead of going through the settings model.
+    """
 
     settings: Settings
     pool: AsyncConnectionPool
+    llm_enabled: bool
+    llm_api_key: str | None
 
 
 def create_app(settings: Settings) -> App:
     """Create the application container.
 
     Note:
-        The returned DB pool is not opened. Call `await app.pool.open()` at startup.
+        The returned DB pool is not opened. Call `await app.pool.open(wait=True)` at startup so the
+        `DB_POOL_MIN_SIZE` connections are established before the first message arrives.
     """
 
-    pool = create_pool(settings.database_url, max_size=10)
-    return App(settings=settings, pool=pool)
+    pool = create_pool(
+        settings.database_url,
+        min_size=settings.db_pool_min_size,
+        max_size=settings.db_pool_max_size,
+    )
+    return App(
+        settings=settings,
+        pool=pool,
+        llm_enabled=settings.llm_enabled,
+        llm_api_key=settings.llm_api_key,
+    )
 
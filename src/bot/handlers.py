@@ -6,8 +6,10 @@ leading '-'). On any unsupported input or internal error, reply `0` and log inte
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
+from collections import OrderedDict
+from datetime import UTC, date, datetime
 from time import monotonic
 
 from aiogram.types import Message
@@ -15,44 +17,122 @@ from aiogram.types import Message
 from src.app import App
 from src.db.pool import get_conn
 from src.db.query import fetch_scalar_int
-from src.intent.parser import IntentParserError, parse_intent_with_source
+from src.intent.dates import has_sub_day_relative_phrase
+from src.intent.parser import IntentParserError, ParseResult, parse_intent_with_source
 from src.sql.builder import SQLBuilderError, build_query
 
 logger = logging.getLogger(__name__)
-_INTEGER_REPLY_RE = re.compile(r"^-?\d+$")
 
+_PARSE_CACHE_SIZE = 2048
 
-def _is_command_text(text: str) -> bool:
-    return text.lstrip().startswith("/")
+# Parsed intents keyed by (text, LLM flag, UTC day). In rules mode the text is lowercased with
+# whitespace collapsed (the rules parser is case-insensitive); in LLM mode it is exactly the text
+# sent to the model, which sees case (e.g. creator IDs). The day is part of the key because relative
+# dates ("сегодня", "вчера") resolve differently once the calendar day changes; text with sub-day
+# relative units ("час назад") depends on the clock and is never cached.
+_parse_cache: OrderedDict[tuple[str, bool, date], ParseResult] = OrderedDict()
+
+# LLM parses currently running in a worker thread, by cache key. Handlers run as tasks, so identical
+# messages arriving together await the same parse instead of each issuing an LLM request.
+_inflight_parses: dict[tuple[str, bool, date], asyncio.Future[ParseResult]] = {}
+
+
+def _parse_cache_key(raw_text: str, *, llm_enabled: bool) -> tuple[str, bool, date]:
+    text = raw_text if llm_enabled else " ".join(raw_text.lower().split())
+    return text, llm_enabled, datetime.now(UTC).date()
+
+
+def _store_parse(key: tuple[str, bool, date], result: ParseResult) -> None:
+    if has_sub_day_relative_phrase(key[0].lower()):
+        return
+    _parse_cache[key] = result
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+
+
+async def _parse_llm_and_store(
+        key: tuple[str, bool, date],
+        raw_text: str,
+        llm_api_key: str | None,
+) -> ParseResult:
+    try:
+        # The LLM call is blocking HTTP (with retries); keep it off the event loop.
+        result = await asyncio.to_thread(
+            parse_intent_with_source,
+            raw_text,
+            llm_enabled=True,
+            llm_api_key=llm_api_key,
+        )
+        # Rules fallbacks (LLM error/timeout) are not cached, so a transient LLM failure does not
+        # pin the query to the rules parser.
+        if result.source == "llm":
+            _store_parse(key, result)
+        return result
+    finally:
+        _inflight_parses.pop(key, None)
+
+
+async def _parse_cached(raw_text: str, app: App) -> ParseResult:
+    """Parse text into a `ParseResult`, reusing results for repeated queries.
+
+    Only successful parses are cached; unsupported input is re-parsed (and rejected) every time.
+    With the LLM enabled, only LLM-sourced results are cached and concurrent identical queries
+    share one in-flight parse.
+    """
+
+    key = _parse_cache_key(raw_text, llm_enabled=app.llm_enabled)
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        _parse_cache.move_to_end(key)
+        return cached
+
+    if app.llm_enabled:
+        pending = _inflight_parses.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(_parse_llm_and_store(key, raw_text, app.llm_api_key))
+            _inflight_parses[key] = pending
+        # Shielded: a cancelled handler must not cancel the parse other waiters share.
+        return await asyncio.shield(pending)
+
+    result = parse_intent_with_source(raw_text, llm_enabled=False)
+    _store_parse(key, result)
+    return result
 
 
 def _sanitize_reply(text: str) -> str:
     """Return a safe digits-only reply string (fallback to `0`)."""
 
     value = (text or "").strip()
-    if _INTEGER_REPLY_RE.fullmatch(value):
-        return value
-    return "0"
+    if not value:
+        return "0"
+    # `str.isdigit` also accepts non-ASCII digits (e.g. "²"); require ASCII to keep `^-?\d+$`.
+    body = value[1:] if value[0] == "-" else value
+    return value if body and body.isascii() and body.isdigit() else "0"
+
+
+async def reply_zero(message: Message) -> None:
+    """Reply `0` to messages that are rejected by router filters (commands, no text)."""
+
+    await message.answer("0")
 
 
 async def handle_message(message: Message, app: App) -> None:
     """Handle any incoming Telegram message and reply with exactly one integer string."""
 
-    started = monotonic()
+    # Latency is only logged at INFO; skip the clock reads entirely when INFO is filtered out.
+    log_latency = logger.isEnabledFor(logging.INFO)
+    started = monotonic() if log_latency else 0.0
     result_text = "0"
 
     # noinspection PyBroadException
     try:
         raw_text = (message.text or message.caption or "")
-        if not raw_text.strip() or _is_command_text(raw_text):
+        stripped = raw_text.strip()
+        if not stripped or stripped[0] == "/":
             await message.answer("0")
             return
 
-        parse_result = parse_intent_with_source(
-            raw_text,
-            llm_enabled=app.settings.llm_enabled,
-            llm_api_key=app.settings.llm_api_key,
-        )
+        parse_result = await _parse_cached(raw_text, app)
         sql, params = build_query(parse_result.intent)
 
         async with get_conn(app.pool) as conn:
@@ -60,18 +140,20 @@ async def handle_message(message: Message, app: App) -> None:
 
         result_text = str(value)
 
-        latency_ms = int((monotonic() - started) * 1000)
-        logger.info(
-            "handled source=%s operation=%s metric=%s latency_ms=%d",
-            parse_result.source,
-            parse_result.intent.operation,
-            parse_result.intent.metric,
-            latency_ms,
-        )
+        if log_latency:
+            latency_ms = int((monotonic() - started) * 1000)
+            logger.info(
+                "handled source=%s operation=%s metric=%s latency_ms=%d",
+                parse_result.source,
+                parse_result.intent.operation,
+                parse_result.intent.metric,
+                latency_ms,
+            )
     except (IntentParserError, SQLBuilderError) as exc:
         # Unsupported/unparseable input -> 0 (no stack trace needed).
-        latency_ms = int((monotonic() - started) * 1000)
-        logger.info("unsupported reason=%s latency_ms=%d", exc, latency_ms)
+        if log_latency:
+            latency_ms = int((monotonic() - started) * 1000)
+            logger.info("unsupported reason=%s latency_ms=%d", exc, latency_ms)
     except Exception:
         # Handler boundary: any internal error must result in a numeric reply ("0"),
         # without leaking details.
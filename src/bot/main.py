@@ -7,6 +7,7 @@ import logging
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 
 from src.app import create_app
 from src.bot.router import router
@@ -15,22 +16,46 @@ from src.config.settings import load_settings
 
 logger = logging.getLogger(__name__)
 
+# Long-poll timeout for `getUpdates` (seconds); Telegram holds the request open until updates
+# arrive.
+_POLLING_TIMEOUT_S = 25
+# Max simultaneous connections of the Bot API HTTP session (polling + concurrent replies).
+_BOT_SESSION_CONN_LIMIT = 50
+
 
 async def main() -> None:
     """Run the Telegram bot polling loop."""
 
+    # Start tasks (including aiogram's per-update handler tasks) eagerly: the handler runs
+    # synchronously up to its first real `await` instead of waiting for the next loop iteration.
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     settings = load_settings()
     configure_logging()
 
     app = create_app(settings)
+    # `wait=True` blocks until `min_size` connections are up, so the pool is warm before polling.
     await app.pool.open(wait=True)
 
-    bot = Bot(token=settings.telegram_bot_token, default=DefaultBotProperties(parse_mode=None))
+    bot = Bot(
+        token=settings.telegram_bot_token,
+        session=AiohttpSession(limit=_BOT_SESSION_CONN_LIMIT),
+        default=DefaultBotProperties(parse_mode=None),
+    )
     dp = Dispatcher()
     dp.include_router(router)
 
     try:
-        await dp.start_polling(bot, app=app)
+        # Updates are handled as tasks, so the next `getUpdates` overlaps with handler DB work.
+        # Concurrency is capped at the DB pool size: extra tasks would only queue on the pool.
+        await dp.start_polling(
+            bot,
+            app=app,
+            polling_timeout=_POLLING_TIMEOUT_S,
+            handle_as_tasks=True,
+            tasks_concurrency_limit=settings.db_pool_max_size,
+            allowed_updates=["message"],
+        )
     finally:
         logger.info("shutting down")
         await app.pool.close()
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from aiogram import Router
+from aiogram import F, Router
 
-from src.bot.handlers import handle_message
+from src.bot.handlers import handle_message, reply_zero
 
 router = Router(name="root")
+# Cheap magic-filter checks answer commands and text-less messages without entering the full
+# handler. `handle_message` still guards against these itself (e.g. captions starting with "/").
+router.message.register(reply_zero, F.text.startswith("/"))
+router.message.register(reply_zero, ~(F.text | F.caption))
 router.message.register(handle_message)
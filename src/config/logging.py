@@ -4,6 +4,29 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+
+class _UTCISOFormatter(logging.Formatter):
+    """Formatter rendering `asctime` as an ISO-8601 UTC timestamp with milliseconds.
+
+    The `YYYY-MM-DDTHH:MM:SS` part is formatted at most once per second and reused, so most records
+    skip the `strftime`/`gmtime` calls entirely.
+    """
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._cached_second = -1
+        self._cached_prefix = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = second
+        return f"{self._cached_prefix}.{int(record.msecs):03d}Z"
 
 
 def configure_logging(level: str | None = None) -> None:
@@ -13,11 +36,17 @@ def configure_logging(level: str | None = None) -> None:
     user.
     """
 
+    # The log format never uses thread/process/task fields; skip collecting them per record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(_UTCISOFormatter(_LOG_FORMAT))
+
     log_level = (level or os.getenv("LOG_LEVEL") or "INFO").upper()
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s %(levelname)s %(name)s %(message)s",
-    )
+    logging.basicConfig(level=log_level, handlers=[handler])
 
     # Reduce noisy third-party logs by default.
     logging.getLogger("aiogram.event").setLevel(logging.WARNING)
@@ -9,6 +9,8 @@ session timezone to UTC for deterministic date boundaries.
 
 from __future__ import annotations
 
+from functools import cache
+
 from pydantic import Field, ValidationError, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -24,11 +26,14 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     telegram_bot_token: str = Field(alias="TELEGRAM_BOT_TOKEN")
     database_url: str = Field(alias="DATABASE_URL")
     db_timezone: str = Field(default="UTC", alias="DB_TIMEZONE")
+    db_pool_min_size: int = Field(default=4, ge=1, alias="DB_POOL_MIN_SIZE")
+    db_pool_max_size: int = Field(default=10, ge=1, alias="DB_POOL_MAX_SIZE")
 
     llm_enabled: bool = Field(default=False, alias="LLM_ENABLED")
     llm_api_key: str | None = Field(default=None, alias="LLM_API_KEY")
@@ -46,6 +51,14 @@ class Settings(BaseSettings):
             raise ValueError("DB_TIMEZONE must be UTC")
         return "UTC"
 
+    @model_validator(mode="after")
+    def validate_db_pool_sizes(self) -> Settings:
+        """Validate that the DB pool bounds are consistent (`min_size <= max_size`)."""
+
+        if self.db_pool_min_size > self.db_pool_max_size:
+            raise ValueError("DB_POOL_MIN_SIZE must be <= DB_POOL_MAX_SIZE")
+        return self
+
     @model_validator(mode="after")
     def validate_llm_config(self) -> Settings:
         """Validate the optional LLM parser configuration.
@@ -58,9 +71,15 @@ class Settings(BaseSettings):
         return self
 
 
+@cache
 def load_settings() -> Settings:
     """Load and validate settings from environment variables.
 
+    The validated (frozen) settings are cached for the lifetime of the process, so repeated calls
+    don't re-read `.env` or re-run validation; later changes to the environment or `.env` are not
+    picked up. Call `load_settings.cache_clear()` after changing them (tests do this around every
+    test). Failed loads are not cached.
+
     Raises:
         RuntimeError: If the environment configuration is missing or invalid.
     """
@@ -8,6 +8,7 @@ from __future__ import annotations
 import os
 
 import psycopg
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
 
 
 def require_database_url() -> str:
@@ -19,6 +20,21 @@ def require_database_url() -> str:
     return database_url
 
 
+def utc_conninfo(database_url: str) -> str:
+    """Return a conninfo string that sets the session timezone to UTC at connection startup.
+
+    The timezone is passed via libpq `options` (`-c TimeZone=UTC`), so no extra `SET` round-trip is
+    needed. Existing `options` from `database_url` are preserved. PgBouncer rejects this startup
+    parameter unless `ignore_startup_parameters` includes `options`, and never forwards it; the
+    pool's `configure_connection` then sets UTC itself.
+    """
+
+    params = conninfo_to_dict(database_url)
+    options = params.get("options") or ""
+    params["options"] = f"{options} -c TimeZone=UTC".strip()
+    return make_conninfo("", **params)
+
+
 def connect_utc(database_url: str) -> psycopg.Connection:
     """Connect to Postgres and lock the session timezone to UTC."""
 
@@ -9,44 +9,79 @@ Keeping this conversion in one place prevents drift between loader behavior and
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping
+from operator import itemgetter
 from typing import Any
 
+# Fields are pulled out in one C-level `itemgetter` call per row, then coerced: the streaming
+# loader's `ijson` decodes non-integer JSON numbers (e.g. `12.0`) as `Decimal`, and some dumps store
+# counters as strings; both must reach the BIGINT columns as integers. IDs are coerced with `str()`
+# for the TEXT columns.
+_get_video_fields = itemgetter(
+    "id",
+    "creator_id",
+    "video_created_at",
+    "views_count",
+    "likes_count",
+    "comments_count",
+    "reports_count",
+    "created_at",
+    "updated_at",
+)
+_get_snapshot_fields = itemgetter(
+    "id",
+    "video_id",
+    "views_count",
+    "likes_count",
+    "comments_count",
+    "reports_count",
+    "delta_views_count",
+    "delta_likes_count",
+    "delta_comments_count",
+    "delta_reports_count",
+    "created_at",
+    "updated_at",
+)
 
-def iter_video_rows(videos: Sequence[dict[str, Any]]) -> Iterable[tuple[Any, ...]]:
+
+def video_row(video: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Return the `videos` table row tuple for a single video object."""
+
+    vid, creator_id, video_created_at, views, likes, comments, reports, created, updated = (
+        _get_video_fields(video)
+    )
+    return (
+        str(vid),
+        str(creator_id),
+        video_created_at,
+        int(views),
+        int(likes),
+        int(comments),
+        int(reports),
+        created,
+        updated,
+    )
+
+
+def _snapshot_row(snapshot: Mapping[str, Any]) -> tuple[Any, ...]:
+    sid, video_id, *counts, created, updated = _get_snapshot_fields(snapshot)
+    return (str(sid), str(video_id), *map(int, counts), created, updated)
+
+
+def video_snapshot_rows(video: Mapping[str, Any]) -> Iterable[tuple[Any, ...]]:
+    """Yield `video_snapshots` table row tuples for the snapshots embedded in a single video."""
+
+    return map(_snapshot_row, video.get("snapshots", ()))
+
+
+def iter_video_rows(videos: Iterable[Mapping[str, Any]]) -> Iterable[tuple[Any, ...]]:
     """Yield row tuples for inserting into the `videos` table."""
 
-    for video in videos:
-        yield (
-            str(video["id"]),
-            str(video["creator_id"]),
-            video["video_created_at"],
-            int(video["views_count"]),
-            int(video["likes_count"]),
-            int(video["comments_count"]),
-            int(video["reports_count"]),
-            video["created_at"],
-            video["updated_at"],
-        )
-
-
-def iter_snapshot_rows(videos: Sequence[dict[str, Any]]) -> Iterable[tuple[Any, ...]]:
+    return map(video_row, videos)
+
+
+def iter_snapshot_rows(videos: Iterable[Mapping[str, Any]]) -> Iterable[tuple[Any, ...]]:
     """Yield row tuples for inserting into the `video_snapshots` table."""
 
     for video in videos:
-        for snapshot in video.get("snapshots", []):
-            yield (
-                str(snapshot["id"]),
-                str(snapshot["video_id"]),
-                int(snapshot["views_count"]),
-                int(snapshot["likes_count"]),
-                int(snapshot["comments_count"]),
-                int(snapshot["reports_count"]),
-                int(snapshot["delta_views_count"]),
-                int(snapshot["delta_likes_count"]),
-                int(snapshot["delta_comments_count"]),
-                int(snapshot["delta_reports_count"]),
-                snapshot["created_at"],
-                snapshot["updated_at"],
-            )
-
+        yield from video_snapshot_rows(video)
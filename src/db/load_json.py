@@ -2,130 +2,230 @@
 
 The dataset is expected to be a JSON object with a single top-level key `"videos"` containing a list
 of video objects. Each video includes final counters and an embedded `"snapshots"` list.
+
+The file is stream-parsed (`ijson`) and rows are bulk-loaded with `COPY` into temporary staging
+tables, then upserted into the target tables. Peak memory stays flat in the number of snapshots.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
-from collections.abc import Iterable
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, BinaryIO
 from urllib.request import urlopen
 
+import ijson
 from dotenv import load_dotenv
 
 from src.db.connection import connect_utc, require_database_url
-from src.db.dataset_rows import iter_snapshot_rows, iter_video_rows
+from src.db.dataset_rows import video_row, video_snapshot_rows
+
+_CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE videos_staging
+    (
+        LIKE videos,
+        seq BIGSERIAL
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE video_snapshots_staging
+    (
+        LIKE video_snapshots,
+        seq BIGSERIAL
+    ) ON COMMIT DROP;
+"""
+
+_COPY_VIDEOS_SQL = """
+    COPY videos_staging (id,
+                         creator_id,
+                         video_created_at,
+                         views_count,
+                         likes_count,
+                         comments_count,
+                         reports_count,
+                         created_at,
+                         updated_at) FROM STDIN
+"""
+
+_COPY_SNAPSHOTS_SQL = """
+    COPY video_snapshots_staging (id,
+                                  video_id,
+                                  views_count,
+                                  likes_count,
+                                  comments_count,
+                                  reports_count,
+                                  delta_views_count,
+                                  delta_likes_count,
+                                  delta_comments_count,
+                                  delta_reports_count,
+                                  created_at,
+                                  updated_at) FROM STDIN
+"""
+
+# `DISTINCT ON ... ORDER BY seq DESC` keeps the last occurrence of a duplicated id, matching the
+# row-by-row upsert semantics (a single INSERT cannot update the same target row twice).
+_UPSERT_VIDEOS_SQL = """
+    INSERT INTO videos (id,
+                        creator_id,
+                        video_created_at,
+                        views_count,
+                        likes_count,
+                        comments_count,
+                        reports_count,
+                        created_at,
+                        updated_at)
+    SELECT DISTINCT ON (id) id,
+                            creator_id,
+                            video_created_at,
+                            views_count,
+                            likes_count,
+                            comments_count,
+                            reports_count,
+                            created_at,
+                            updated_at
+    FROM videos_staging
+    ORDER BY id, seq DESC
+    ON CONFLICT (id) DO
+    UPDATE SET
+        creator_id = EXCLUDED.creator_id,
+        video_created_at = EXCLUDED.video_created_at,
+        views_count = EXCLUDED.views_count,
+        likes_count = EXCLUDED.likes_count,
+        comments_count = EXCLUDED.comments_count,
+        reports_count = EXCLUDED.reports_count,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at
+"""
+
+_UPSERT_SNAPSHOTS_SQL = """
+    INSERT INTO video_snapshots (id,
+                                 video_id,
+                                 views_count,
+                                 likes_count,
+                                 comments_count,
+                                 reports_count,
+                                 delta_views_count,
+                                 delta_likes_count,
+                                 delta_comments_count,
+                                 delta_reports_count,
+                                 created_at,
+                                 updated_at)
+    SELECT DISTINCT ON (id) id,
+                            video_id,
+                            views_count,
+                            likes_count,
+                            comments_count,
+                            reports_count,
+                            delta_views_count,
+                            delta_likes_count,
+                            delta_comments_count,
+                            delta_reports_count,
+                            created_at,
+                            updated_at
+    FROM video_snapshots_staging
+    ORDER BY id, seq DESC
+    ON CONFLICT (id) DO
+    UPDATE SET
+        video_id = EXCLUDED.video_id,
+        views_count = EXCLUDED.views_count,
+        likes_count = EXCLUDED.likes_count,
+        comments_count = EXCLUDED.comments_count,
+        reports_count = EXCLUDED.reports_count,
+        delta_views_count = EXCLUDED.delta_views_count,
+        delta_likes_count = EXCLUDED.delta_likes_count,
+        delta_comments_count = EXCLUDED.delta_comments_count,
+        delta_reports_count = EXCLUDED.delta_reports_count,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at
+"""
+
 
+_FORMAT_ERROR = "Unexpected dataset format: expected object with key 'videos' containing a list"
 
-def _load_json_bytes(*, path: str | None, url: str | None) -> bytes:
+
+@contextmanager
+def _open_json_stream(*, path: str | None, url: str | None) -> Iterator[BinaryIO]:
     if bool(path) == bool(url):
         raise ValueError("Exactly one of --path or --url must be provided")
 
     if path:
-        return Path(path).read_bytes()
+        with Path(path).open("rb") as fp:
+            yield fp
+        return
 
     assert url is not None
-    with urlopen(url) as resp:  # noqa: S310 (controlled URL from CLI)
-        return resp.read()
+    # The format check reads the stream before loading does, so spool the download to a seekable
+    # temp file.
+    with urlopen(url) as resp, tempfile.TemporaryFile() as fp:  # noqa: S310 (controlled URL from CLI)
+        shutil.copyfileobj(resp, fp)
+        fp.seek(0)
+        yield fp
 
 
-def _chunks(iterable: Iterable[tuple], size: int) -> Iterable[list[tuple]]:
-    chunk: list[tuple] = []
-    for item in iterable:
-        chunk.append(item)
-        if len(chunk) >= size:
-            yield chunk
-            chunk = []
-    if chunk:
-        yield chunk
+def _require_videos_array(fp: BinaryIO) -> None:
+    """Check that `fp` holds an object whose `"videos"` key is a list, then rewind it.
 
+    Only the events up to the `"videos"` key are parsed, so the check is cheap when the key comes
+    first (as in the provided dataset).
+    """
 
-def load_dataset(*, path: str | None, url: str | None, truncate: bool, batch_size: int) -> None:
-    """Load the dataset into `videos` and `video_snapshots` tables."""
+    events = ijson.parse(fp)
+    first = next(events, None)
+    if first is None or first[1] != "start_map":
+        raise ValueError(_FORMAT_ERROR)
+    for prefix, event, _value in events:
+        if prefix == "videos":
+            if event != "start_array":
+                raise ValueError(_FORMAT_ERROR)
+            break
+    else:
+        raise ValueError(_FORMAT_ERROR)
+    fp.seek(0)
 
-    if batch_size <= 0:
-        raise ValueError("--batch-size must be a positive integer")
 
-    load_dotenv(".env")
-    database_url = require_database_url()
+def _iter_videos(fp: BinaryIO) -> Iterator[dict[str, Any]]:
+    """Stream video objects from the top-level `"videos"` list."""
+
+    return ijson.items(fp, "videos.item")
 
-    payload_bytes = _load_json_bytes(path=path, url=url)
-    payload = json.loads(payload_bytes)
 
-    if (
-            not isinstance(payload, dict)
-            or "videos" not in payload
-            or not isinstance(payload["videos"], list)
-    ):
-        raise ValueError(
-            "Unexpected dataset format: expected object with key 'videos' containing a list"
-        )
+def load_dataset(*, path: str | None, url: str | None, truncate: bool) -> None:
+    """Load the dataset into `videos` and `video_snapshots` tables."""
 
-    videos: list[dict] = payload["videos"]
+    load_dotenv(".env")
+    database_url = require_database_url()
 
-    with connect_utc(database_url) as conn:
-        with conn.transaction():
+    with _open_json_stream(path=path, url=url) as fp:
+        # Validate before connecting so a malformed file never reaches the TRUNCATE.
+        _require_videos_array(fp)
+        with connect_utc(database_url) as conn, conn.transaction():
             with conn.cursor() as cur:
                 if truncate:
                     cur.execute("TRUNCATE video_snapshots, videos", prepare=False)
 
-                cur.executemany(
-                    """
-                    INSERT INTO videos (id,
-                                        creator_id,
-                                        video_created_at,
-                                        views_count,
-                                        likes_count,
-                                        comments_count,
-                                        reports_count,
-                                        created_at,
-                                        updated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (id) DO
-                    UPDATE SET
-                        creator_id = EXCLUDED.creator_id,
-                        video_created_at = EXCLUDED.video_created_at,
-                        views_count = EXCLUDED.views_count,
-                        likes_count = EXCLUDED.likes_count,
-                        comments_count = EXCLUDED.comments_count,
-                        reports_count = EXCLUDED.reports_count,
-                        created_at = EXCLUDED.created_at,
-                        updated_at = EXCLUDED.updated_at
-                    """,
-                    list(iter_video_rows(videos)),
-                )
-
-                for snapshot_batch in _chunks(iter_snapshot_rows(videos), batch_size):
-                    cur.executemany(
-                        """
-                        INSERT INTO video_snapshots (id,
-                                                     video_id,
-                                                     views_count,
-                                                     likes_count,
-                                                     comments_count,
-                                                     reports_count,
-                                                     delta_views_count,
-                                                     delta_likes_count,
-                                                     delta_comments_count,
-                                                     delta_reports_count,
-                                                     created_at,
-                                                     updated_at)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (id) DO
-                        UPDATE SET
-                            video_id = EXCLUDED.video_id,
-                            views_count = EXCLUDED.views_count,
-                            likes_count = EXCLUDED.likes_count,
-                            comments_count = EXCLUDED.comments_count,
-                            reports_count = EXCLUDED.reports_count,
-                            delta_views_count = EXCLUDED.delta_views_count,
-                            delta_likes_count = EXCLUDED.delta_likes_count,
-                            delta_comments_count = EXCLUDED.delta_comments_count,
-                            delta_reports_count = EXCLUDED.delta_reports_count,
-                            created_at = EXCLUDED.created_at,
-                            updated_at = EXCLUDED.updated_at
-                        """,
-                        snapshot_batch,
-                    )
+                cur.execute(_CREATE_STAGING_SQL, prepare=False)
+
+                # Snapshots dominate the dataset, so they are streamed straight into COPY; the much
+                # smaller video rows are buffered and copied once the stream is exhausted.
+                video_rows: list[tuple[Any, ...]] = []
+                with cur.copy(_COPY_SNAPSHOTS_SQL) as copy:
+                    for video in _iter_videos(fp):
+                        video_rows.append(video_row(video))
+                        for row in video_snapshot_rows(video):
+                            copy.write_row(row)
+
+                # An empty `videos` list loads nothing (beyond an optional TRUNCATE).
+                if not video_rows:
+                    return
+
+                with cur.copy(_COPY_VIDEOS_SQL) as copy:
+                    for row in video_rows:
+                        copy.write_row(row)
+
+                cur.execute(_UPSERT_VIDEOS_SQL, prepare=False)
+                cur.execute(_UPSERT_SNAPSHOTS_SQL, prepare=False)
 
 
 def main() -> None:
@@ -143,8 +243,8 @@ def main() -> None:
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=1_000,
-        help="Number of snapshot rows per insert batch.",
+        default=None,
+        help="Deprecated and ignored: rows are now bulk-loaded with COPY.",
     )
     args = parser.parse_args()
 
@@ -152,7 +252,6 @@ def main() -> None:
         path=args.path,
         url=args.url,
         truncate=args.truncate,
-        batch_size=args.batch_size,
     )
 
 
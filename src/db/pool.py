@@ -1,7 +1,8 @@
 """Async Postgres connection pool.
 
-The bot and query pipeline use an async pool (psycopg3) for efficient DB access. Every acquired
-connection is configured to use UTC at the session level.
+The bot and query pipeline use an async pool (psycopg3) for efficient DB access. Every pooled
+connection is locked to UTC at the session level via libpq startup options (with a one-time `SET`
+fallback when a pooler drops them), so acquiring a connection costs no extra round-trips.
 """
 
 from __future__ import annotations
@@ -13,8 +14,8 @@ from dotenv import load_dotenv
 from psycopg import AsyncConnection
 from psycopg_pool import AsyncConnectionPool
 
-from src.db.connection import require_database_url
-from src.db.session import ensure_utc
+from src.db.connection import require_database_url, utc_conninfo
+from src.db.session import configure_connection
 
 
 def create_pool(
@@ -36,20 +37,18 @@ def create_pool(
         database_url = require_database_url()
 
     return AsyncConnectionPool(
-        conninfo=database_url,
+        conninfo=utc_conninfo(database_url),
         min_size=min_size,
         max_size=max_size,
         timeout=timeout,
         open=False,
-        configure=ensure_utc,
+        configure=configure_connection,
     )
 
 
 @asynccontextmanager
 async def get_conn(pool: AsyncConnectionPool) -> AsyncIterator[AsyncConnection]:
-    """Acquire a connection from the pool with UTC session timezone enforced."""
+    """Acquire a connection from the pool (UTC session timezone is set at connection startup)."""
 
     async with pool.connection() as conn:
-        # Extra safety: enforce UTC on every acquire, even if the pool config already does it.
-        await ensure_utc(conn)
         yield conn
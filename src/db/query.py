@@ -17,19 +17,17 @@ async def fetch_scalar_int(conn: AsyncConnection, sql: str, params: tuple[Any, .
     Contract:
         - Returns `0` if the query yields no rows or the first column is NULL.
         - The query must be parameterized; all values are passed via `params`.
+        - The first column should be an integer type (builder queries cast to `::bigint`); the
+          value is still passed through `int()` so other numeric types return an `int` too.
         - DB errors are not swallowed (caller decides how to handle them).
     """
 
-    async with conn.cursor() as cur:
-        await cur.execute(cast(LiteralString, sql), params)
-        row = await cur.fetchone()
+    # `conn.execute` uses a transient cursor, skipping the cursor context-manager awaits. Binary
+    # results let psycopg load the bigint straight into a Python `int` (no text parsing).
+    cur = await conn.execute(cast(LiteralString, sql), params, binary=True)
+    row = await cur.fetchone()
 
-    if not row:
+    if not row or row[0] is None:
         return 0
 
-    value = row[0]
-    if value is None:
-        return 0
-
-    return int(value)
-
+    return int(row[0])
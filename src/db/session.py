@@ -3,18 +3,44 @@
 The project requires deterministic date boundaries: all timestamps are treated as UTC and user
 "days" are interpreted as UTC calendar days. For that to be reliable, every DB session must be
 locked to the UTC timezone.
+
+Pool connections are set up by `configure_connection` (see `src.db.pool.create_pool`).
 """
 
 from __future__ import annotations
 
 from psycopg import AsyncConnection
 
+# The bot issues a small family of parameterized query shapes. With a threshold of 0 psycopg
+# prepares each shape on its first execution per connection (instead of the default fifth), so
+# every later execution is a bind-only round-trip with no warmup.
+PREPARE_THRESHOLD = 0
+
 
 async def ensure_utc(conn: AsyncConnection) -> None:
-    """Ensure the current Postgres session timezone is set to UTC."""
+    """Ensure the current Postgres session timezone is set to UTC.
+
+    Called by `configure_connection` only when the startup option did not take effect.
+    """
+
+    await conn.execute("SELECT pg_catalog.set_config('TimeZone', 'UTC', false)", prepare=False)
+    # Without autocommit, psycopg wraps the statement in an implicit transaction; commit so the
+    # setting persists and the pool doesn't see INTRANS. Autocommit sessions skip that round-trip.
+    if not conn.autocommit:
+        await conn.commit()
+
+
+async def configure_connection(conn: AsyncConnection) -> None:
+    """Configure a newly created pool connection.
+
+    Contract, once per physical connection:
+        - `prepare_threshold` is set to `PREPARE_THRESHOLD` (0: prepare on first execution).
+        - The session timezone is UTC. It is normally applied via startup options (see
+          `utc_conninfo`) and reported back by the server, so no query is issued. Poolers such as
+          PgBouncer do not forward startup options; if the reported timezone is not UTC, this
+          falls back to `ensure_utc`.
+    """
 
-    async with conn.cursor() as cur:
-        await cur.execute("SET TIME ZONE 'UTC'", prepare=False)
-    # `SET` starts a transaction when autocommit is disabled; commit so the pool doesn't see
-    # INTRANS.
-    await conn.commit()
+    conn.prepare_threshold = PREPARE_THRESHOLD
+    if conn.info.parameter_status("TimeZone") != "UTC":
+        await ensure_utc(conn)
@@ -8,20 +8,45 @@ All user "dates" are interpreted as UTC calendar days:
 from __future__ import annotations
 
 import re
+import threading
 from calendar import monthrange
 from datetime import UTC, date, datetime, time, timedelta
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
 
-import dateparser
-from dateparser.conf import Settings as DateparserSettings
-from dateparser.search import search_dates
+if TYPE_CHECKING:
+    from dateparser.conf import Settings as DateparserSettings
+    from dateparser.date import DateDataParser
 
-_DATEPARSER_SETTINGS = DateparserSettings().replace(
-    STRICT_PARSING=True,
-    DATE_ORDER="DMY",
-    TIMEZONE="UTC",
-    TO_TIMEZONE="UTC",
-    RETURN_AS_TIMEZONE_AWARE=True,
-)
+
+# `dateparser` is slow to import (locale tables); load it on the first lookup that needs it.
+@cache
+def _dateparser_settings() -> DateparserSettings:
+    from dateparser.conf import Settings as DateparserSettings
+
+    return DateparserSettings().replace(
+        STRICT_PARSING=True,
+        DATE_ORDER="DMY",
+        TIMEZONE="UTC",
+        TO_TIMEZONE="UTC",
+        RETURN_AS_TIMEZONE_AWARE=True,
+    )
+
+
+@cache
+def _ru_date_parser() -> DateDataParser:
+    # `dateparser.parse(..., languages=...)` builds a new `DateDataParser` on every call; reuse one.
+    from dateparser.date import DateDataParser
+
+    return DateDataParser(languages=["ru"], settings=_dateparser_settings())
+
+
+# The bot runs LLM-mode parses (and their rules fallback) in worker threads. The shared
+# `DateDataParser` and `search_dates`' module-level search object keep per-call state and are not
+# documented as thread-safe, so every dateparser call goes through this lock.
+_DATEPARSER_LOCK = threading.Lock()
+
+_DATE_RANGE_CACHE_SIZE = 4096
 
 _RU_MONTH_NAMES: tuple[str, ...] = (
     "января",
@@ -75,6 +100,15 @@ _RU_MONTHS_NOM: dict[str, int] = {name: idx + 1 for idx, name in enumerate(_RU_M
 _RU_MONTH_PATTERN_NOM = "|".join(_RU_MONTH_NAMES_NOM)
 
 _YEAR_RE = re.compile(r"\b\d{4}\b")
+_HAS_DIGIT_RE = re.compile(r"\d")
+# Without digits, `dateparser` can only resolve relative phrases ("вчера", "неделю назад",
+# "в прошлом году"). Deliberately permissive: a false hit just costs one `dateparser` call.
+_RELATIVE_DATE_HINT_RE = re.compile(
+    r"вчера|сегодн|завтра|сейчас|назад|через|недел|месяц|год|лет|сутк|час|минут|секунд"
+)
+# Relative units finer than a day ("час назад", "через 30 минут", "сейчас") resolve against the
+# clock, not the UTC day: "час назад" is yesterday at 00:30 UTC and today at 02:00.
+_SUB_DAY_RELATIVE_RE = re.compile(r"час|минут|секунд")
 
 _RANGE_SAME_MONTH_RE = re.compile(
     rf"\bс\s+(?P<d1>\d{{1,2}})\s+по\s+(?P<d2>\d{{1,2}})\s+"
@@ -100,11 +134,8 @@ _MONTH_ONLY_GEN_RE = re.compile(
 
 
 def _parse_ru_date_fragment(fragment: str) -> date | None:
-    dt = dateparser.parse(
-        fragment,
-        languages=["ru"],
-        settings=_DATEPARSER_SETTINGS,
-    )
+    with _DATEPARSER_LOCK:
+        dt = _ru_date_parser().get_date_data(fragment).date_obj
     if not dt:
         return None
     if dt.tzinfo is None:
@@ -112,14 +143,17 @@ def _parse_ru_date_fragment(fragment: str) -> date | None:
     return dt.date()
 
 
-def _extract_yearful_dates(text: str) -> list[date]:
-    results = search_dates(
-        text,
-        languages=["ru"],
-        settings=_DATEPARSER_SETTINGS,
-    )
+def _extract_yearful_dates(text: str) -> tuple[date, ...]:
+    from dateparser.search import search_dates
+
+    with _DATEPARSER_LOCK:
+        results = search_dates(
+            text,
+            languages=["ru"],
+            settings=_dateparser_settings(),
+        )
     if not results:
-        return []
+        return ()
 
     parsed: list[date] = []
     for matched, dt in results:
@@ -128,7 +162,7 @@ def _extract_yearful_dates(text: str) -> list[date]:
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=UTC)
         parsed.append(dt.date())
-    return parsed
+    return tuple(parsed)
 
 
 def _parse_month_range(match: re.Match[str], month_map: dict[str, int]) -> tuple[date, date]:
@@ -138,6 +172,16 @@ def _parse_month_range(match: re.Match[str], month_map: dict[str, int]) -> tuple
     return date(year, month, 1), date(year, month, last_day)
 
 
+def has_sub_day_relative_phrase(text: str) -> bool:
+    """Return True if lowercased `text` may hold a relative date finer than a UTC day.
+
+    Results for such text depend on the current time, so callers must not memoize them per day.
+    Deliberately permissive (e.g. "15 часов" also matches): a false hit only skips a cache.
+    """
+
+    return _SUB_DAY_RELATIVE_RE.search(text) is not None
+
+
 def parse_date_range(text: str) -> tuple[date, date] | None:
     """Parse a single day or an inclusive range from text.
 
@@ -149,20 +193,59 @@ def parse_date_range(text: str) -> tuple[date, date] | None:
     if not value:
         return None
 
-    match = _RANGE_SAME_MONTH_RE.search(value)
-    if match:
-        year = int(match.group("y"))
-        month = _RU_MONTHS[match.group("m")]
-        start = date(year, month, int(match.group("d1")))
-        end = date(year, month, int(match.group("d2")))
-        return (start, end) if start <= end else (end, start)
-
-    match = _RANGE_MONTH_TO_MONTH_SAME_YEAR_RE.search(value)
-    if match:
-        year = int(match.group("y"))
-        start = date(year, _RU_MONTHS[match.group("m1")], int(match.group("d1")))
-        end = date(year, _RU_MONTHS[match.group("m2")], int(match.group("d2")))
-        return (start, end) if start <= end else (end, start)
+    if has_sub_day_relative_phrase(value):
+        return _parse_date_range_value(value)
+    return _parse_date_range_for_day(value, datetime.now(UTC).date())
+
+
+@lru_cache(maxsize=_DATE_RANGE_CACHE_SIZE)
+def _parse_date_range_for_day(value: str, utc_day: date) -> tuple[date, date] | None:
+    """Memoized `_parse_date_range_value` (`dateparser` calls are slow).
+
+    `utc_day` is only part of the cache key: relative phrases ("вчера") resolve against the current
+    UTC day, so cached results must not outlive it. Sub-day phrases bypass this cache entirely.
+    """
+
+    return _parse_date_range_value(value)
+
+
+def _parse_date_range_value(value: str) -> tuple[date, date] | None:
+    """Parse lowercased, stripped text."""
+
+    # All patterns (and `search_dates` matches, which must contain a year) need a digit. Digit-less
+    # text can only be a relative phrase, which the whole-string fallback handles.
+    if _HAS_DIGIT_RE.search(value):
+        parsed = _parse_numeric_date_range(value)
+        if parsed is not None:
+            return parsed
+    elif not _RELATIVE_DATE_HINT_RE.search(value):
+        return None
+
+    # Fallback: try parsing the whole string as a single date fragment.
+    d = _parse_ru_date_fragment(value)
+    if d:
+        return d, d
+
+    return None
+
+
+def _parse_numeric_date_range(value: str) -> tuple[date, date] | None:
+    # Both explicit range patterns require "с ... по ...".
+    if "по" in value:
+        match = _RANGE_SAME_MONTH_RE.search(value)
+        if match:
+            year = int(match.group("y"))
+            month = _RU_MONTHS[match.group("m")]
+            start = date(year, month, int(match.group("d1")))
+            end = date(year, month, int(match.group("d2")))
+            return (start, end) if start <= end else (end, start)
+
+        match = _RANGE_MONTH_TO_MONTH_SAME_YEAR_RE.search(value)
+        if match:
+            year = int(match.group("y"))
+            start = date(year, _RU_MONTHS[match.group("m1")], int(match.group("d1")))
+            end = date(year, _RU_MONTHS[match.group("m2")], int(match.group("d2")))
+            return (start, end) if start <= end else (end, start)
 
     for regex, month_map in (
             (_MONTH_ONLY_PREP_RE, _RU_MONTHS_PREP),
@@ -180,11 +263,6 @@ def parse_date_range(text: str) -> tuple[date, date] | None:
         d = yearful_dates[0]
         return d, d
 
-    # Fallback: try parsing the whole string as a single date fragment.
-    d = _parse_ru_date_fragment(value)
-    if d:
-        return d, d
-
     return None
 
 
@@ -6,7 +6,7 @@ Ambiguous metric terms (e.g. "реакции") are treated as unsupported.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from src.intent.schema import Comparator, Metric
 
@@ -36,37 +36,96 @@ COMPARATOR_SYNONYMS: dict[Comparator, tuple[str, ...]] = {
     "=": ("равняется", "равно", "ровно"),
 }
 
+COMPARATOR_PHRASE_TO_OP: dict[str, Comparator] = {
+    phrase: op for op, phrases in COMPARATOR_SYNONYMS.items() for phrase in phrases
+}
+
 
-@dataclass(frozen=True)
-class ComparatorMatch:
+class ComparatorMatch(NamedTuple):
     """A concrete RU phrase matched to a canonical SQL comparator operator."""
 
     op: Comparator
     phrase: str
 
 
-_COMPARATOR_MATCHES: list[ComparatorMatch] = sorted(
-    (
-        ComparatorMatch(op=op, phrase=phrase)
-        for op, phrases in COMPARATOR_SYNONYMS.items()
-        for phrase in phrases
-    ),
-    key=lambda m: (-len(m.phrase), m.phrase),
+# Longest phrase first (e.g. "не больше" before "больше"); frozen, built once at import.
+_COMPARATOR_MATCHES: tuple[ComparatorMatch, ...] = tuple(
+    sorted(
+        (
+            ComparatorMatch(op=op, phrase=phrase)
+            for op, phrases in COMPARATOR_SYNONYMS.items()
+            for phrase in phrases
+        ),
+        key=lambda m: (-len(m.phrase), m.phrase),
+    )
+)
+_COMPARATOR_PHRASES_SORTED: tuple[str, ...] = tuple(m.phrase for m in _COMPARATOR_MATCHES)
+
+# Space-padded phrases in match-priority order, so detection needs no per-phrase allocation.
+_PADDED_COMPARATOR_PHRASES: tuple[tuple[str, Comparator], ...] = tuple(
+    (f" {m.phrase} ", m.op) for m in _COMPARATOR_MATCHES
 )
 
 
+def tokenize(text: str) -> frozenset[str]:
+    """Return the set of whitespace-separated tokens of (normalized) text.
+
+    Parsers tokenize once and pass the result to the `*_in_tokens` helpers below.
+    """
+
+    return frozenset((text or "").split())
+
+
+def find_metrics_in_tokens(tokens: frozenset[str]) -> set[Metric]:
+    """Return all metrics mentioned among pre-tokenized text (by known synonyms)."""
+
+    return {METRIC_TERM_TO_METRIC[t] for t in tokens if t in METRIC_TERM_TO_METRIC}
+
+
+def has_ambiguous_metric_token(tokens: frozenset[str]) -> bool:
+    """Whether pre-tokenized text contains an ambiguous metric term (unsupported in MVP)."""
+
+    return not tokens.isdisjoint(AMBIGUOUS_METRIC_TERMS)
+
+
+def detect_single_metric_in_tokens(tokens: frozenset[str]) -> Metric | None:
+    """Detect exactly one metric among pre-tokenized text (see `detect_single_metric`)."""
+
+    found: Metric | None = None
+    for token in tokens:
+        metric = METRIC_TERM_TO_METRIC.get(token)
+        if metric is None or metric is found:
+            continue
+        if found is not None:
+            # A second distinct metric makes the text ambiguous; stop scanning.
+            return None
+        found = metric
+    return found
+
+
+def classify_metric_tokens(tokens: frozenset[str]) -> tuple[bool, Metric | None]:
+    """Classify the metric mention of pre-tokenized text in one call.
+
+    Returns:
+        `(is_ambiguous, metric)`: `metric` is the single mentioned metric, or `None` when there is
+        none, several, or the text is ambiguous.
+    """
+
+    if has_ambiguous_metric_token(tokens):
+        return True, None
+    return False, detect_single_metric_in_tokens(tokens)
+
+
 def find_metrics(text: str) -> set[Metric]:
     """Return all metrics explicitly mentioned in the text (by known synonyms)."""
 
-    tokens = set((text or "").split())
-    return {METRIC_TERM_TO_METRIC[t] for t in tokens if t in METRIC_TERM_TO_METRIC}
+    return find_metrics_in_tokens(tokenize(text))
 
 
 def has_ambiguous_metric_term(text: str) -> bool:
     """Whether the text contains an ambiguous metric term (unsupported in MVP)."""
 
-    tokens = set((text or "").split())
-    return any(t in AMBIGUOUS_METRIC_TERMS for t in tokens)
+    return has_ambiguous_metric_token(tokenize(text))
 
 
 def detect_single_metric(text: str) -> Metric | None:
@@ -76,17 +135,16 @@ def detect_single_metric(text: str) -> Metric | None:
         The metric if exactly one is present; otherwise `None`.
     """
 
-    metrics = find_metrics(text)
-    if len(metrics) == 1:
-        return next(iter(metrics))
-    return None
+    return detect_single_metric_in_tokens(tokenize(text))
 
 
 def detect_comparator(text: str) -> Comparator | None:
     """Detect a comparator operator in text (>, >=, <, <=, =)."""
 
+    # Substring checks run in C and beat a single regex scan on these short texts; the longest
+    # phrase wins (e.g. "не больше" over "больше").
     padded = f" {text} "
-    for match in _COMPARATOR_MATCHES:
-        if f" {match.phrase} " in padded:
-            return match.op
+    for phrase, op in _PADDED_COMPARATOR_PHRASES:
+        if phrase in padded:
+            return op
     return None
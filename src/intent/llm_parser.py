@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
@@ -27,8 +29,18 @@ class LLMConfig:
     model: str = "gpt-4o-mini"
     api_base: str = "https://api.openai.com/v1"
     timeout_s: float = 30.0
+    max_tokens: int = 256
+    max_retries: int = 2
 
 
+# Transient statuses worth retrying (rate limit / gateway / overload).
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_BACKOFF_S = 0.5
+_RETRY_BACKOFF_MAX_S = 4.0
+
+
+# The prompt is static; read it once per process.
+@cache
 def _load_prompt() -> str:
     prompt_path = Path(__file__).resolve().parent / "prompt_intent_v1.md"
     return prompt_path.read_text(encoding="utf-8")
@@ -43,10 +55,30 @@ def _strip_code_fences(text: str) -> str:
     return value
 
 
+@cache
 def _chat_completions_url(api_base: str) -> str:
     return api_base.rstrip("/") + "/chat/completions"
 
 
+def _post_with_retries(req: Request, *, config: LLMConfig) -> bytes:
+    """POST the request, retrying transient failures with bounded exponential backoff."""
+
+    attempt = 0
+    while True:
+        try:
+            with urlopen(req, timeout=config.timeout_s) as resp:  # noqa: S310 (explicit, feature-flagged network call)
+                return resp.read()
+        except HTTPError as exc:
+            if exc.code not in _RETRYABLE_STATUSES or attempt >= config.max_retries:
+                raise LLMParserError(f"LLM HTTP error: {exc.code}") from exc
+        except URLError as exc:
+            if attempt >= config.max_retries:
+                raise LLMParserError("LLM connection error") from exc
+
+        time.sleep(min(_RETRY_BACKOFF_S * 2**attempt, _RETRY_BACKOFF_MAX_S))
+        attempt += 1
+
+
 def parse_intent_json_via_llm(user_text: str, *, config: LLMConfig) -> dict[str, Any]:
     """Call an LLM and return the parsed JSON object.
 
@@ -58,6 +90,9 @@ def parse_intent_json_via_llm(user_text: str, *, config: LLMConfig) -> dict[str,
     payload = {
         "model": config.model,
         "temperature": 0,
+        # Intent JSON is small; bound the completion and ask for a bare JSON object.
+        "max_tokens": config.max_tokens,
+        "response_format": {"type": "json_object"},
         "messages": [
             {"role": "system", "content": prompt},
             {"role": "user", "content": user_text},
@@ -74,13 +109,7 @@ def parse_intent_json_via_llm(user_text: str, *, config: LLMConfig) -> dict[str,
         data=json.dumps(payload).encode(),
     )
 
-    try:
-        with urlopen(req, timeout=config.timeout_s) as resp:  # noqa: S310 (explicit, feature-flagged network call)
-            body = resp.read()
-    except HTTPError as exc:
-        raise LLMParserError(f"LLM HTTP error: {exc.code}") from exc
-    except URLError as exc:
-        raise LLMParserError("LLM connection error") from exc
+    body = _post_with_retries(req, config=config)
 
     try:
         decoded = json.loads(body)
@@ -88,6 +117,12 @@ def parse_intent_json_via_llm(user_text: str, *, config: LLMConfig) -> dict[str,
     except Exception as exc:  # noqa: BLE001
         raise LLMParserError("Unexpected LLM response format") from exc
 
+    try:
+        return json.loads(content)
+    except (TypeError, json.JSONDecodeError):
+        pass
+
+    # Fallback for APIs that ignore `response_format` and wrap the JSON in code fences.
     try:
         return json.loads(_strip_code_fences(content))
     except json.JSONDecodeError as exc:
@@ -101,6 +136,7 @@ def llm_config_from_env(*, api_key: str | None = None) -> LLMConfig:
         - LLM_MODEL
         - LLM_API_BASE
         - LLM_TIMEOUT_S
+        - LLM_MAX_RETRIES
     """
 
     key = api_key or os.getenv("LLM_API_KEY") or ""
@@ -108,9 +144,11 @@ def llm_config_from_env(*, api_key: str | None = None) -> LLMConfig:
         raise LLMParserError("LLM_API_KEY is required")
 
     timeout_s = float(os.getenv("LLM_TIMEOUT_S") or "30")
+    max_retries = int(os.getenv("LLM_MAX_RETRIES") or "2")
     return LLMConfig(
         api_key=key,
         model=os.getenv("LLM_MODEL") or "gpt-4o-mini",
         api_base=os.getenv("LLM_API_BASE") or "https://api.openai.com/v1",
         timeout_s=timeout_s,
+        max_retries=max_retries,
     )
@@ -4,9 +4,16 @@ from __future__ import annotations
 
 import re
 
-_NON_WORD_RE = re.compile(r"[^0-9a-zа-я_\-\s]+", flags=re.IGNORECASE)
+# Applied after lowercasing, so no IGNORECASE (case folding per character is measurably slower).
+_NON_WORD_RE = re.compile(r"[^0-9a-zа-я_\-\s]+")
 _MULTISPACE_RE = re.compile(r"\s+")
 
+# Single-pass character rewrites:
+#   - `ё` -> `е`;
+#   - common unicode dashes -> ASCII hyphen;
+#   - quotes/backticks -> separators, preserving the contents (e.g. IDs).
+_TRANSLATE_TABLE = str.maketrans({"ё": "е", "—": "-", "–": "-", "`": " ", '"': " ", "'": " "})
+
 
 def normalize_text(text: str) -> str:
     """Normalize user text for rules-based parsing.
@@ -21,14 +28,7 @@ def normalize_text(text: str) -> str:
     """
 
     value = (text or "").strip().lower()
-    value = value.replace("ё", "е")
-
-    # Normalize common unicode dashes to ASCII hyphen.
-    value = value.replace("—", "-").replace("–", "-")
-
-    # Treat quotes/backticks as separators but preserve the contents (e.g. IDs).
-    value = value.replace("`", " ").replace('"', " ").replace("'", " ")
-
+    value = value.translate(_TRANSLATE_TABLE)
     value = _NON_WORD_RE.sub(" ", value)
     value = _MULTISPACE_RE.sub(" ", value).strip()
     return value
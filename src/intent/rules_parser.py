@@ -9,15 +9,19 @@ This parser is intentionally strict and deterministic:
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from datetime import date as dt_date
 from datetime import time as dt_time
+from functools import lru_cache
+from typing import NamedTuple
 
 from src.intent import dates
 from src.intent.dictionaries import (
-    _COMPARATOR_MATCHES,
+    _COMPARATOR_PHRASES_SORTED,
+    COMPARATOR_PHRASE_TO_OP,
     METRIC_TERM_TO_METRIC,
-    detect_single_metric,
-    has_ambiguous_metric_term,
+    classify_metric_tokens,
 )
 from src.intent.normalize import normalize_text
 from src.intent.schema import (
@@ -25,6 +29,7 @@ from src.intent.schema import (
     DateRangeScope,
     Filters,
     Intent,
+    Metric,
     Operation,
     Threshold,
     ThresholdAppliesTo,
@@ -36,8 +41,7 @@ class RulesParserError(ValueError):
     """Raised when the rules parser cannot produce a valid intent."""
 
 
-@dataclass(frozen=True)
-class _ThresholdMatch:
+class _ThresholdMatch(NamedTuple):
     metric_term: str
     comparator_phrase: str
     value: int
@@ -47,50 +51,76 @@ _CREATOR_ID_RE = re.compile(
     r"\b(?:креатора?|creator)(?:\s+с)?\s*(?:id|айди|идентификатор|creator_id)?\s*[=:]?\s*(?P<id>[0-9a-z_\-]{3,})\b"
 )
 
+# Threshold values always contain a digit; normalized text only keeps ASCII digits.
+_HAS_DIGIT_RE = re.compile(r"[0-9]")
+
 _TIME_WINDOW_RE = re.compile(
     r"\bс\s+(?P<h1>\d{1,2})(?:\s+(?P<m1>\d{2}))?\s+до\s+"
     r"(?P<h2>\d{1,2})(?:\s+(?P<m2>\d{2}))?\b"
 )
 
 
-def _has_all_time_phrase(text: str) -> bool:
-    padded = f" {text} "
-    return any(
-        phrase in padded
-        for phrase in (
-            " за все время ",
-            " за всё время ",
-            " за весь период ",
-            " all time ",
-        )
-    )
+_ALL_TIME_PHRASES: tuple[str, ...] = (
+    " за все время ",
+    " за всё время ",
+    " за весь период ",
+    " all time ",
+)
 
 
-def _has_as_of_phrase(text: str) -> bool:
-    # Keep this strict to avoid confusing "к" in other contexts.
-    if " на тот момент " in f" {text} ":
-        return True
-    if " на дату " in f" {text} ":
-        return True
-    if re.search(r"\bк\s+\d{1,2}\s", text):
-        return True
+_AS_OF_PHRASES: tuple[str, ...] = (
+    " на тот момент ",
+    " на дату ",
+)
+
+# "к 10 ..." as in "к 10 ноября".
+_AS_OF_K_RE = re.compile(r"\bк\s+\d{1,2}\s")
+
+
+def _has_all_time_phrase(padded: str) -> bool:
+    for phrase in _ALL_TIME_PHRASES:
+        if phrase in padded:
+            return True
     return False
 
 
-def _has_snapshot_term(text: str) -> bool:
-    tokens = set(text.split())
+def _has_as_of_phrase(text: str, padded: str) -> bool:
+    # Keep this strict to avoid confusing "к" in other contexts.
+    for phrase in _AS_OF_PHRASES:
+        if phrase in padded:
+            return True
+    return _AS_OF_K_RE.search(text) is not None
+
+
+# Word-prefix classes used by the operation detectors, found in one scan (see `_token_prefixes`).
+# `(?<!\S)` anchors at token starts (unlike `\b`, it does not match after "-").
+_TOKEN_PREFIX_RE = re.compile(
+    r"(?<!\S)(?:"
+    r"(?P<snapshot>замер|измер|снимк|снапш)"
+    r"|(?P<count>скольк)"
+    r"|(?P<video>видео)"
+    r"|(?P<new>нов)"
+    r"|(?P<day>дн)"
+    r"|(?P<growth>увеличил)"
+    r")"
+)
+
+
+def _token_prefixes(text: str) -> frozenset[str]:
+    """Return the names of `_TOKEN_PREFIX_RE` classes that start some token of the text."""
+
+    return frozenset(m.lastgroup for m in _TOKEN_PREFIX_RE.finditer(text) if m.lastgroup)
+
+
+def _has_snapshot_term(tokens: frozenset[str], prefixes: frozenset[str]) -> bool:
     return (
-            any(t.startswith("замер") for t in tokens)
-            or any(t.startswith("измер") for t in tokens)
-            or any(t.startswith("снимк") for t in tokens)
-            or any(t.startswith("снапш") for t in tokens)
+            "snapshot" in prefixes
             or "snapshot" in tokens
             or "snapshots" in tokens
     )
 
 
-def _has_negative_delta_phrase(text: str) -> bool:
-    padded = f" {text} "
+def _has_negative_delta_phrase(text: str, padded: str) -> bool:
     return (
             "отриц" in text
             or " стало меньше " in padded
@@ -102,15 +132,20 @@ def _has_negative_delta_phrase(text: str) -> bool:
     )
 
 
-def _has_count_videos_phrase(text: str) -> bool:
+# "How many" question words: "сколько" plus the nouns "количество"/"число" ("the number of").
+_COUNT_NOUNS: frozenset[str] = frozenset({"количество", "число"})
+_COUNT_QUESTION_WORDS: frozenset[str] = _COUNT_NOUNS | {"сколько"}
+_ROLIK_FORMS: frozenset[str] = frozenset({"ролик", "ролика", "ролики", "роликов"})
+
+
+def _has_count_videos_phrase(words: list[str]) -> bool:
     """Whether the wording is explicitly asking for a count of videos."""
 
-    tokens = text.split()
-    for idx, tok in enumerate(tokens):
-        if not (tok.startswith("скольк") or tok in {"количество", "число"}):
+    for idx, tok in enumerate(words):
+        if not (tok.startswith("скольк") or tok in _COUNT_NOUNS):
             continue
 
-        lookahead = tokens[idx + 1: idx + 4]
+        lookahead = words[idx + 1: idx + 4]
         if any(t.startswith("видео") for t in lookahead):
             return True
         if any(t.startswith("ролик") for t in lookahead):
@@ -119,15 +154,14 @@ def _has_count_videos_phrase(text: str) -> bool:
     return False
 
 
-def _has_count_creators_phrase(text: str) -> bool:
+def _has_count_creators_phrase(words: list[str]) -> bool:
     """Whether the wording is explicitly asking for a count of creators."""
 
-    tokens = text.split()
-    for idx, tok in enumerate(tokens):
-        if not (tok.startswith("скольк") or tok in {"количество", "число"}):
+    for idx, tok in enumerate(words):
+        if not (tok.startswith("скольк") or tok in _COUNT_NOUNS):
             continue
 
-        lookahead = tokens[idx + 1: idx + 5]
+        lookahead = words[idx + 1: idx + 5]
         if any(t.startswith("креатор") for t in lookahead):
             return True
         if any(t.startswith("creator") for t in lookahead):
@@ -138,23 +172,20 @@ def _has_count_creators_phrase(text: str) -> bool:
     return False
 
 
-def _has_distinct_publish_days_phrase(text: str) -> bool:
+def _has_distinct_publish_days_phrase(
+        text: str, tokens: frozenset[str], prefixes: frozenset[str]
+) -> bool:
     """Whether the wording is asking for a count of distinct publish calendar days."""
 
-    tokens = set(text.split())
-    has_count = (
-        any(t.startswith("скольк") for t in tokens)
-        or "количество" in tokens
-        or "число" in tokens
-    )
+    has_count = "count" in prefixes or not tokens.isdisjoint(_COUNT_NOUNS)
     if not has_count:
         return False
 
-    has_day = any(t.startswith("дн") for t in tokens)
+    has_day = "day" in prefixes
     if not has_day:
         return False
 
-    has_video = any(t.startswith("видео") for t in tokens)
+    has_video = "video" in prefixes
     if not has_video:
         return False
 
@@ -180,6 +211,10 @@ def _parse_time_parts(hour: str, minute: str | None) -> dt_time | None:
 def _extract_time_window(text: str) -> TimeWindow | None:
     """Extract a time window like "с 10:00 до 15:00" (normalized as "с 10 00 до 15 00")."""
 
+    # The pattern needs a standalone "до"; skip the regex scan for the common window-less text.
+    if " до " not in text:
+        return None
+
     match = _TIME_WINDOW_RE.search(text)
     if not match:
         return None
@@ -192,50 +227,53 @@ def _extract_time_window(text: str) -> TimeWindow | None:
     return TimeWindow(start_time=start_time, end_time=end_time)
 
 
-def _detect_operation(text: str) -> Operation:
-    padded = f" {text} "
-    tokens = set(text.split())
-    metric = detect_single_metric(text)
+# Single-word markers of a "sum of deltas" (growth) question.
+_GROWTH_TOKENS: frozenset[str] = frozenset({"насколько", "прирост", "вырос", "выросли"})
+
+
+def _detect_operation(
+        text: str,
+        padded: str,
+        words: list[str],
+        tokens: frozenset[str],
+        metric: Metric | None,
+) -> Operation:
+    prefixes = _token_prefixes(text)
 
     # Count snapshot measurements where per-snapshot delta is negative.
     if (
-            _has_snapshot_term(text)
-            and _has_negative_delta_phrase(text)
-            and ("сколько" in tokens or "количество" in tokens or "число" in tokens)
+            _has_snapshot_term(tokens, prefixes)
+            and _has_negative_delta_phrase(text, padded)
+            and not tokens.isdisjoint(_COUNT_QUESTION_WORDS)
     ):
         return Operation.count_snapshots_with_negative_delta
 
     # Sum of deltas ("growth on a day") intent.
     if (
-            " на сколько " in padded
-            or " насколько " in padded
-            or " прирост " in padded
-            or " вырос " in padded
-            or " выросли " in padded
-            or " увеличил" in padded
-            or " увеличил" in padded
+            not tokens.isdisjoint(_GROWTH_TOKENS)
+            or "growth" in prefixes
+            or " на сколько " in padded
     ):
         return Operation.sum_delta_metric
 
     # Count distinct videos with positive delta.
-    if "сколько" in tokens and "видео" in tokens and any(t.startswith("нов") for t in tokens):
+    if "сколько" in tokens and "видео" in tokens and "new" in prefixes:
         return Operation.count_distinct_videos_with_positive_delta
 
-    if _has_distinct_publish_days_phrase(text):
+    if _has_distinct_publish_days_phrase(text, tokens, prefixes):
         return Operation.count_distinct_publish_days
 
     # Count videos explicitly asked as "сколько/количество ... видео".
-    if _has_count_videos_phrase(text):
+    if _has_count_videos_phrase(words):
         return Operation.count_videos
 
     # Count distinct creators matching filters.
-    if _has_count_creators_phrase(text):
+    if _has_count_creators_phrase(words):
         return Operation.count_distinct_creators
 
-    # Sum of final totals across videos (not deltas).
-    if metric is not None and (
-            not _has_count_videos_phrase(text) and not _has_count_creators_phrase(text)
-    ):
+    # Sum of final totals across videos (not deltas). Both explicit count phrases were ruled out
+    # above.
+    if metric is not None:
         if (
                 "в сумме" in padded
                 or "суммар" in text
@@ -247,78 +285,111 @@ def _detect_operation(text: str) -> Operation:
         ):
             return Operation.sum_total_metric
 
-    if (
-        any(t.startswith("скольк") for t in tokens)
-        or "количество" in tokens
-        or "число" in tokens
-    ):
-        if "видео" in tokens or any(t.startswith("видео") for t in tokens):
+    if "count" in prefixes or not tokens.isdisjoint(_COUNT_NOUNS):
+        if "video" in prefixes:
             return Operation.count_videos
-        if any(t in {"ролик", "ролика", "ролики", "роликов"} for t in tokens):
+        if not tokens.isdisjoint(_ROLIK_FORMS):
             return Operation.count_videos
 
     raise RulesParserError("unsupported query")
 
 
 def _extract_creator_id(text: str) -> str | None:
+    # Most queries never mention a creator; skip the regex scan for them.
+    if "креатор" not in text and "creator" not in text:
+        return None
+
     match = _CREATOR_ID_RE.search(text)
     if not match:
         return None
     return match.group("id")
 
 
-def _build_regex_alternation(phrases: list[str]) -> str:
+def _build_regex_alternation(phrases: Iterable[str]) -> str:
     # Sort by length desc to prefer longer phrases (e.g. "не больше" over "больше").
     parts = sorted(phrases, key=lambda p: (-len(p), p))
     return "|".join(re.escape(p) for p in parts)
 
 
+def _build_threshold_pattern() -> re.Pattern[str]:
+    metric_group = _build_regex_alternation(list(METRIC_TERM_TO_METRIC))
+    comparator_group = _build_regex_alternation(_COMPARATOR_PHRASES_SORTED)
+    value_group = r"\d[\d\s_]*"
+
+    comp_first = (
+        rf"(?P<cf_comp>{comparator_group})\s+(?P<cf_value>{value_group})"
+        rf"\s+(?P<cf_metric>{metric_group})\b"
+    )
+    metric_first = (
+        rf"(?P<mf_metric>{metric_group})\s+(?P<mf_comp>{comparator_group})"
+        rf"\s+(?P<mf_value>{value_group})\b"
+    )
+    return re.compile(rf"\b(?=(?P<cf>{comp_first})|(?P<mf>{metric_first}))")
+
+
+# "<comparator> <value> <metric>" and "<metric> <comparator> <value>" in a single scan.
+# Both orders sit inside a lookahead so a match of one order never hides an overlapping
+# match of the other; each order keeps its own end offset to stay non-overlapping itself.
+_THRESHOLD_RE = _build_threshold_pattern()
+
+
+# Digit-group separators allowed inside threshold values ("100 000", "100_000").
+_THRESHOLD_VALUE_STRIP = str.maketrans("", "", " _")
+
+
+def _parse_threshold_value(raw_value: str) -> int:
+    return int(raw_value.translate(_THRESHOLD_VALUE_STRIP))
+
+
 def _extract_threshold_matches(text: str) -> list[_ThresholdMatch]:
-    metric_terms = sorted(METRIC_TERM_TO_METRIC.keys(), key=lambda s: (-len(s), s))
-    metric_group = _build_regex_alternation(metric_terms)
-
-    comparator_phrases = [m.phrase for m in _COMPARATOR_MATCHES]
-    comparator_group = _build_regex_alternation(comparator_phrases)
-
-    value_group = r"(?P<value>\d[\d\s_]*)"
-    metric_group_named = rf"(?P<metric>{metric_group})"
-    comp_group_named = rf"(?P<comp>{comparator_group})"
-
-    patterns = [
-        re.compile(rf"\b{comp_group_named}\s+{value_group}\s+{metric_group_named}\b"),
-        re.compile(rf"\b{metric_group_named}\s+{comp_group_named}\s+{value_group}\b"),
-    ]
-
-    matches: list[_ThresholdMatch] = []
-    for pat in patterns:
-        for m in pat.finditer(text):
-            raw_value = m.group("value")
-            value = int(raw_value.replace(" ", "").replace("_", ""))
-            matches.append(
+    comp_first: list[_ThresholdMatch] = []
+    metric_first: list[_ThresholdMatch] = []
+    comp_first_end = metric_first_end = -1
+    for m in _THRESHOLD_RE.finditer(text):
+        start = m.start()
+        if m.group("cf") is not None:
+            if start < comp_first_end:
+                continue
+            comp_first_end = m.end("cf")
+            comp_first.append(
+                _ThresholdMatch(
+                    metric_term=m.group("cf_metric"),
+                    comparator_phrase=m.group("cf_comp"),
+                    value=_parse_threshold_value(m.group("cf_value")),
+                )
+            )
+        else:
+            if start < metric_first_end:
+                continue
+            metric_first_end = m.end("mf")
+            metric_first.append(
                 _ThresholdMatch(
-                    metric_term=m.group("metric"),
-                    comparator_phrase=m.group("comp"),
-                    value=value,
+                    metric_term=m.group("mf_metric"),
+                    comparator_phrase=m.group("mf_comp"),
+                    value=_parse_threshold_value(m.group("mf_value")),
                 )
             )
-    return matches
+    return comp_first + metric_first
 
 
-def _parse_thresholds(text: str, *, applies_to: ThresholdAppliesTo) -> list[Threshold]:
-    parsed: list[Threshold] = []
+def _parse_thresholds(text: str, *, applies_to: ThresholdAppliesTo) -> tuple[Threshold, ...]:
+    # Deduplicate while preserving order.
+    seen: set[tuple] = set()
+    uniq: list[Threshold] = []
 
     for match in _extract_threshold_matches(text):
         metric = METRIC_TERM_TO_METRIC[match.metric_term]
 
-        op = None
-        for cmp_match in _COMPARATOR_MATCHES:
-            if cmp_match.phrase == match.comparator_phrase:
-                op = cmp_match.op
-                break
+        op = COMPARATOR_PHRASE_TO_OP.get(match.comparator_phrase)
         if op is None:
             continue
 
-        parsed.append(
+        key = (metric, op, match.value)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        uniq.append(
             Threshold(
                 applies_to=applies_to,
                 metric=metric,
@@ -326,60 +397,112 @@ def _parse_thresholds(text: str, *, applies_to: ThresholdAppliesTo) -> list[Thre
                 value=match.value,
             )
         )
+    return tuple(uniq)
 
-    # Deduplicate while preserving order.
-    seen: set[tuple] = set()
-    uniq: list[Threshold] = []
-    for t in parsed:
-        key = (t.applies_to, t.metric, t.op, t.value)
-        if key in seen:
-            continue
-        seen.add(key)
-        uniq.append(t)
-    return uniq
+
+_PARSE_CACHE_SIZE = 1024
+
+# Operation families used by `parse_intent`'s branches (built once, not per call).
+_COUNT_OPERATIONS: frozenset[Operation] = frozenset(
+    {
+        Operation.count_videos,
+        Operation.count_distinct_creators,
+        Operation.count_distinct_publish_days,
+    }
+)
+# Date ranges default to the publish-date scope for these operations...
+_PUBLISHED_SCOPE_OPERATIONS: frozenset[Operation] = _COUNT_OPERATIONS | {Operation.sum_total_metric}
+# ...unless an "as-of" threshold moves the date onto snapshots.
+_AS_OF_SNAPSHOT_SCOPE_OPERATIONS: frozenset[Operation] = frozenset(
+    {
+        Operation.count_videos,
+        Operation.count_distinct_creators,
+        Operation.sum_total_metric,
+    }
+)
+_DELTA_OPERATIONS: frozenset[Operation] = frozenset(
+    {
+        Operation.sum_delta_metric,
+        Operation.count_distinct_videos_with_positive_delta,
+        Operation.count_snapshots_with_negative_delta,
+    }
+)
 
 
 def parse_intent(text: str) -> Intent:
     """Parse an input string into a validated Intent.
 
+    Results are memoized per input text and UTC day; treat the returned Intent as read-only.
+    Case and whitespace differences share a cache entry. Sub-day relative phrases ("час назад")
+    resolve against the clock rather than the day, so they are parsed on every call.
+
     Raises:
         RulesParserError: If the request is unsupported or ambiguous.
     """
 
+    # Lowercased with runs of whitespace (incl. newlines) collapsed: dates are parsed from this
+    # text rather than the normalized one, and `dateparser` misses day matches across line breaks.
+    key = " ".join((text or "").lower().split())
+    if dates.has_sub_day_relative_phrase(key):
+        return _parse_canonical_intent(key)
+    return _parse_intent_for_day(key, datetime.now(UTC).date())
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_intent_for_day(text: str, utc_day: dt_date) -> Intent:
+    """Memoized `_parse_canonical_intent` (failures are not cached).
+
+    `utc_day` is only part of the cache key: relative dates ("вчера") must not outlive the day.
+    """
+
+    return _parse_canonical_intent(text)
+
+
+def _parse_canonical_intent(text: str) -> Intent:
+    """Parse lowercased, whitespace-collapsed text into an Intent."""
+
     normalized = normalize_text(text)
     if not normalized:
         raise RulesParserError("empty input")
 
-    if has_ambiguous_metric_term(normalized):
+    # Space-padded once, for whole-word substring checks in the detectors below.
+    padded = f" {normalized} "
+    # Tokenized once: ordered words for positional checks, a set for membership tests.
+    words = normalized.split()
+    tokens = frozenset(words)
+    is_ambiguous, metric = classify_metric_tokens(tokens)
+    if is_ambiguous:
         raise RulesParserError("ambiguous/unsupported metric term")
 
-    operation = _detect_operation(normalized)
+    operation = _detect_operation(normalized, padded, words, tokens, metric)
+
+    # Reject before the (more expensive) threshold and date extraction.
+    intent_metric = None
+    if operation not in _COUNT_OPERATIONS:
+        intent_metric = metric
+        if intent_metric is None:
+            raise RulesParserError("metric is required/ambiguous")
 
-    as_of = _has_as_of_phrase(normalized)
+    as_of = _has_as_of_phrase(normalized, padded)
     applies_to = ThresholdAppliesTo.snapshot_as_of if as_of else ThresholdAppliesTo.final_total
 
-    thresholds = _parse_thresholds(normalized, applies_to=applies_to)
+    thresholds = (
+        _parse_thresholds(normalized, applies_to=applies_to)
+        if _HAS_DIGIT_RE.search(normalized)
+        else ()
+    )
 
     # Date parsing benefits from keeping punctuation (e.g. "10:00"), so parse from raw text.
-    date_tuple = None if _has_all_time_phrase(normalized) else dates.parse_date_range(text)
+    date_tuple = None if _has_all_time_phrase(padded) else dates.parse_date_range(text)
     date_range = None
     if date_tuple is not None:
         start_date, end_date = date_tuple
-        if operation in {
-            Operation.count_videos,
-            Operation.count_distinct_creators,
-            Operation.count_distinct_publish_days,
-            Operation.sum_total_metric,
-        }:
+        if operation in _PUBLISHED_SCOPE_OPERATIONS:
             scope = DateRangeScope.videos_published_at
         else:
             scope = DateRangeScope.snapshots_created_at
 
-        if as_of and operation in {
-            Operation.count_videos,
-            Operation.count_distinct_creators,
-            Operation.sum_total_metric,
-        }:
+        if as_of and operation in _AS_OF_SNAPSHOT_SCOPE_OPERATIONS:
             scope = DateRangeScope.snapshots_created_at
         date_range = DateRange(
             scope=scope,
@@ -393,22 +516,8 @@ def parse_intent(text: str) -> Intent:
 
     creator_id = _extract_creator_id(normalized)
 
-    intent_metric = None
-    if operation not in {
-        Operation.count_videos,
-        Operation.count_distinct_creators,
-        Operation.count_distinct_publish_days,
-    }:
-        intent_metric = detect_single_metric(normalized)
-        if intent_metric is None:
-            raise RulesParserError("metric is required/ambiguous")
-
     time_window = None
-    if operation in {
-        Operation.sum_delta_metric,
-        Operation.count_distinct_videos_with_positive_delta,
-        Operation.count_snapshots_with_negative_delta,
-    }:
+    if operation in _DELTA_OPERATIONS:
         time_window = _extract_time_window(normalized)
 
     try:
@@ -58,7 +58,7 @@ class DateRange(BaseModel):
     `[start_date 00:00:00, (end_date + 1 day) 00:00:00)`.
     """
 
-    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
     scope: DateRangeScope
     start_date: date
@@ -77,7 +77,7 @@ class DateRange(BaseModel):
 class TimeWindow(BaseModel):
     """A time-of-day filter applied within a single UTC calendar day."""
 
-    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
     start_time: time
     end_time: time
@@ -94,7 +94,7 @@ class TimeWindow(BaseModel):
 class Threshold(BaseModel):
     """A numeric threshold filter combined with AND across all thresholds."""
 
-    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
     applies_to: ThresholdAppliesTo
     metric: Metric
@@ -116,16 +116,20 @@ class Threshold(BaseModel):
 class Filters(BaseModel):
     """Query filters combined using logical AND."""
 
-    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
     creator_id: str | None = None
-    thresholds: list[Threshold] = Field(default_factory=list)
+    thresholds: tuple[Threshold, ...] = ()
 
 
 class Intent(BaseModel):
-    """A fully validated query intent."""
+    """A fully validated query intent.
 
-    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    All schema models are frozen (immutable and hashable), so intents can be shared between callers
+    and used directly as cache keys.
+    """
+
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
     operation: Operation
     metric: Metric | None = None
@@ -6,9 +6,10 @@ tables, operators) are strictly allowlisted; only values become bound parameters
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime
+from functools import lru_cache
 from typing import Any
 
 from src.intent.dates import inclusive_dates_to_half_open
@@ -29,60 +30,103 @@ class SQLBuilderError(ValueError):
     """Raised when an Intent cannot be converted into deterministic SQL."""
 
 
-_ALLOWED_OPERATORS: dict[Comparator, str] = {
-    ">": ">",
-    ">=": ">=",
-    "<": "<",
-    "<=": "<=",
-    "=": "=",
-}
+# Comparator values are the SQL operators themselves, so the allowlist is a plain set.
+_ALLOWED_OPERATORS: frozenset[Comparator] = frozenset({">", ">=", "<", "<=", "="})
+
+# Static SQL fragments. The FROM variants are spelled out in full so the builders pick one instead
+# of concatenating a JOIN onto the base on every call.
+_SNAP_MAX_CTE_SQL = (
+    "WITH snap_max AS ("
+    " SELECT s.video_id,"
+    "        MAX(s.views_count) AS views_count,"
+    "        MAX(s.likes_count) AS likes_count,"
+    "        MAX(s.comments_count) AS comments_count,"
+    "        MAX(s.reports_count) AS reports_count"
+    "   FROM video_snapshots s"
+    "  WHERE s.created_at >= %s AND s.created_at < %s"
+    "  GROUP BY s.video_id"
+    ") "
+)
+_FROM_SNAPSHOTS = "FROM video_snapshots s JOIN videos v ON v.id = s.video_id"
+_FROM_SNAPSHOTS_WITH_SNAP_MAX = _FROM_SNAPSHOTS + " JOIN snap_max sm ON sm.video_id = s.video_id"
+_FROM_VIDEOS = "FROM videos v"
+_FROM_VIDEOS_WITH_SNAP_MAX = _FROM_VIDEOS + " JOIN snap_max sm ON sm.video_id = v.id"
+_PUBLISHED_DATE_CLAUSE = "v.video_created_at >= %s AND v.video_created_at < %s"
+_SNAPSHOT_DATE_CLAUSE = "s.created_at >= %s AND s.created_at < %s"
+_SNAPSHOT_TIME_WINDOW_CLAUSE = "s.created_at >= %s AND s.created_at <= %s"
+# Date filter on snapshots for queries that still run over videos.
+_SNAPSHOT_EXISTS_DATE_CLAUSE = (
+    "EXISTS (SELECT 1 FROM video_snapshots s WHERE s.video_id = v.id AND "
+    + _SNAPSHOT_DATE_CLAUSE
+    + ")"
+)
+
+
+# A parameterized SQL query ready for execution: `(sql, params)`.
+BuiltQuery = tuple[str, tuple[Any, ...]]
+
+_QUERY_CACHE_SIZE = 1024
+_BOUNDS_CACHE_SIZE = 4096
 
+# Built queries keyed by `_intent_cache_key`. Intents come from a small set of shapes and users
+# repeat queries, so most messages resolve to a dict hit instead of re-assembling SQL.
+_query_cache: OrderedDict[tuple[Any, ...], BuiltQuery] = OrderedDict()
 
-@dataclass(frozen=True)
-class BuiltQuery:
-    """A parameterized SQL query ready for execution."""
 
-    sql: str
-    params: tuple[Any, ...]
+@lru_cache(maxsize=_BOUNDS_CACHE_SIZE)
+def _cached_half_open(start: date, end: date) -> tuple[datetime, datetime]:
+    # Snapshot-scoped queries need the same bounds for the CTE and the date clause, and the same
+    # day ranges recur across messages; the returned datetimes are immutable and safe to share.
+    return inclusive_dates_to_half_open(start, end)
 
 
 def _half_open_bounds(date_range: DateRange) -> tuple[datetime, datetime]:
-    return inclusive_dates_to_half_open(date_range.start_date, date_range.end_date)
+    return _cached_half_open(date_range.start_date, date_range.end_date)
 
 
-def _where_and(clauses: list[str]) -> str:
-    if not clauses:
-        return ""
-    return "WHERE " + " AND ".join(clauses)
+def _assemble_sql(cte_sql: str, select_sql: str, from_sql: str, clauses: list[str]) -> str:
+    """Join `[CTE] SELECT ... FROM ... [WHERE a AND b ...]` in a single pass."""
 
+    parts = [cte_sql, select_sql, " ", from_sql]
+    if clauses:
+        parts.append(" WHERE ")
+        parts.append(" AND ".join(clauses))
+    return "".join(parts)
 
-def _final_total_thresholds(thresholds: Iterable[Threshold]) -> list[Threshold]:
-    return [t for t in thresholds if t.applies_to == ThresholdAppliesTo.final_total]
 
+def _partition_thresholds(
+        thresholds: Iterable[Threshold],
+) -> tuple[list[Threshold], list[Threshold]]:
+    """Split thresholds into `(final_total, snapshot_as_of)` in a single pass."""
 
-def _snapshot_as_of_thresholds(thresholds: Iterable[Threshold]) -> list[Threshold]:
-    return [t for t in thresholds if t.applies_to == ThresholdAppliesTo.snapshot_as_of]
+    final_thresholds: list[Threshold] = []
+    snapshot_thresholds: list[Threshold] = []
+    for t in thresholds:
+        if t.applies_to == ThresholdAppliesTo.final_total:
+            final_thresholds.append(t)
+        else:
+            snapshot_thresholds.append(t)
+    return final_thresholds, snapshot_thresholds
 
 
-def _build_threshold_clause(
-        *,
+def _threshold_clause_table(
         table_alias: str,
-        metric: Metric,
-        op: Comparator,
-        value: int,
         column_map: dict[Metric, str],
-) -> tuple[str, list[Any]]:
-    column = column_map[metric]
-    operator = _ALLOWED_OPERATORS[op]
-    return f"{table_alias}.{column} {operator} %s", [value]
+) -> dict[tuple[Metric, Comparator], str]:
+    """Pre-render `alias.column op %s` for every allowlisted (metric, operator) pair."""
+
+    return {
+        (metric, op): f"{table_alias}.{column} {op} %s"
+        for metric, column in column_map.items()
+        for op in _ALLOWED_OPERATORS
+    }
 
 
-def _build_date_clause(column_ref: str, date_range: DateRange) -> tuple[str, list[Any]]:
-    start_dt, end_dt = _half_open_bounds(date_range)
-    return f"{column_ref} >= %s AND {column_ref} < %s", [start_dt, end_dt]
+_FINAL_TOTAL_CLAUSES = _threshold_clause_table("v", VIDEO_TOTAL_COLUMNS)
+_SNAPSHOT_AS_OF_CLAUSES = _threshold_clause_table("sm", SNAPSHOT_TOTAL_COLUMNS)
 
 
-def _build_time_window_clause(column_ref: str, intent: Intent) -> tuple[str, list[Any]]:
+def _time_window_bounds(intent: Intent) -> tuple[datetime, datetime]:
     if intent.date_range is None or intent.time_window is None:
         raise SQLBuilderError(
             "time window clause requires intent.date_range and intent.time_window"
@@ -91,35 +135,23 @@ def _build_time_window_clause(column_ref: str, intent: Intent) -> tuple[str, lis
     day = intent.date_range.start_date
     start_dt = datetime.combine(day, intent.time_window.start_time, tzinfo=UTC)
     end_dt = datetime.combine(day, intent.time_window.end_time, tzinfo=UTC)
-    return f"{column_ref} >= %s AND {column_ref} <= %s", [start_dt, end_dt]
+    return start_dt, end_dt
 
 
-def _build_snap_max_cte(date_range: DateRange) -> tuple[str, list[Any]]:
+def _build_snap_max_cte(date_range: DateRange) -> tuple[str, tuple[datetime, ...]]:
     if date_range.scope != DateRangeScope.snapshots_created_at:
         raise SQLBuilderError("snap_max CTE requires snapshots_created_at scope")
 
-    start_dt, end_dt = _half_open_bounds(date_range)
-    sql = (
-        "WITH snap_max AS ("
-        " SELECT s.video_id,"
-        "        MAX(s.views_count) AS views_count,"
-        "        MAX(s.likes_count) AS likes_count,"
-        "        MAX(s.comments_count) AS comments_count,"
-        "        MAX(s.reports_count) AS reports_count"
-        "   FROM video_snapshots s"
-        "  WHERE s.created_at >= %s AND s.created_at < %s"
-        "  GROUP BY s.video_id"
-        ") "
-    )
-    return sql, [start_dt, end_dt]
+    return _SNAP_MAX_CTE_SQL, _half_open_bounds(date_range)
 
 
-def _threshold_context(intent: Intent) -> tuple[list[Threshold], list[Threshold], str, list[Any]]:
-    final_thresholds = _final_total_thresholds(intent.filters.thresholds)
-    snapshot_thresholds = _snapshot_as_of_thresholds(intent.filters.thresholds)
+def _threshold_context(
+        intent: Intent,
+) -> tuple[list[Threshold], list[Threshold], str, tuple[datetime, ...]]:
+    final_thresholds, snapshot_thresholds = _partition_thresholds(intent.filters.thresholds)
 
     if not snapshot_thresholds:
-        return final_thresholds, snapshot_thresholds, "", []
+        return final_thresholds, snapshot_thresholds, "", ()
 
     if intent.date_range is None:
         raise SQLBuilderError("snapshot_as_of thresholds require date_range")
@@ -129,10 +161,7 @@ def _threshold_context(intent: Intent) -> tuple[list[Threshold], list[Threshold]
 
 
 def _from_snapshots_with_videos(snapshot_thresholds: list[Threshold]) -> str:
-    from_sql = "FROM video_snapshots s JOIN videos v ON v.id = s.video_id"
-    if snapshot_thresholds:
-        from_sql += " JOIN snap_max sm ON sm.video_id = s.video_id"
-    return from_sql
+    return _FROM_SNAPSHOTS_WITH_SNAP_MAX if snapshot_thresholds else _FROM_SNAPSHOTS
 
 
 def _append_creator_filter(
@@ -152,19 +181,11 @@ def _append_thresholds(
         params: list[Any],
         thresholds: Iterable[Threshold],
         *,
-        table_alias: str,
-        column_map: dict[Metric, str],
+        clause_map: dict[tuple[Metric, Comparator], str],
 ) -> None:
     for t in thresholds:
-        clause, p = _build_threshold_clause(
-            table_alias=table_alias,
-            metric=t.metric,
-            op=t.op,
-            value=t.value,
-            column_map=column_map,
-        )
-        clauses.append(clause)
-        params.extend(p)
+        clauses.append(clause_map[t.metric, t.op])
+        params.append(t.value)
 
 
 def _snapshot_query_context(
@@ -172,114 +193,101 @@ def _snapshot_query_context(
         *,
         initial_clauses: list[str] | None = None,
 ) -> tuple[str, list[str], list[Any], str]:
-    clauses: list[str] = list(initial_clauses or [])
-    params: list[Any] = []
-
     final_thresholds, snapshot_thresholds, cte_sql, cte_params = _threshold_context(intent)
-    params.extend(cte_params)
+    clauses: list[str] = list(initial_clauses or [])
+    params: list[Any] = list(cte_params)
 
     from_sql = _from_snapshots_with_videos(snapshot_thresholds)
 
     # Date filter on snapshots.
     if intent.date_range is not None:
         if intent.time_window is None:
-            clause, p = _build_date_clause("s.created_at", intent.date_range)
+            clauses.append(_SNAPSHOT_DATE_CLAUSE)
+            params.extend(_half_open_bounds(intent.date_range))
         else:
-            clause, p = _build_time_window_clause("s.created_at", intent)
-        clauses.append(clause)
-        params.extend(p)
+            clauses.append(_SNAPSHOT_TIME_WINDOW_CLAUSE)
+            params.extend(_time_window_bounds(intent))
 
     # Creator filter.
     _append_creator_filter(clauses, params, creator_id=intent.filters.creator_id)
 
     # Thresholds.
-    _append_thresholds(
-        clauses,
-        params,
-        final_thresholds,
-        table_alias="v",
-        column_map=VIDEO_TOTAL_COLUMNS,
-    )
-    _append_thresholds(
-        clauses,
-        params,
-        snapshot_thresholds,
-        table_alias="sm",
-        column_map=SNAPSHOT_TOTAL_COLUMNS,
-    )
+    _append_thresholds(clauses, params, final_thresholds, clause_map=_FINAL_TOTAL_CLAUSES)
+    _append_thresholds(clauses, params, snapshot_thresholds, clause_map=_SNAPSHOT_AS_OF_CLAUSES)
 
     return from_sql, clauses, params, cte_sql
 
 
 def _video_query_context(intent: Intent) -> tuple[str, list[str], list[Any], str]:
-    clauses: list[str] = []
-    params: list[Any] = []
-
     final_thresholds, snapshot_thresholds, cte_sql, cte_params = _threshold_context(intent)
-    params.extend(cte_params)
+    clauses: list[str] = []
+    params: list[Any] = list(cte_params)
 
-    from_sql = "FROM videos v"
-    if snapshot_thresholds:
-        from_sql += " JOIN snap_max sm ON sm.video_id = v.id"
+    from_sql = _FROM_VIDEOS_WITH_SNAP_MAX if snapshot_thresholds else _FROM_VIDEOS
 
     _append_creator_filter(clauses, params, creator_id=intent.filters.creator_id)
 
     if intent.date_range is not None:
         if intent.date_range.scope == DateRangeScope.videos_published_at:
-            clause, p = _build_date_clause("v.video_created_at", intent.date_range)
-            clauses.append(clause)
-            params.extend(p)
+            clauses.append(_PUBLISHED_DATE_CLAUSE)
+            params.extend(_half_open_bounds(intent.date_range))
         elif (
                 intent.date_range.scope == DateRangeScope.snapshots_created_at
                 and not snapshot_thresholds
         ):
             # Apply the date filter via snapshots existence, but still query over videos.
-            clause, p = _build_date_clause("s.created_at", intent.date_range)
-            clauses.append(
-                "EXISTS (SELECT 1 FROM video_snapshots s WHERE s.video_id = v.id AND "
-                + clause
-                + ")"
-            )
-            params.extend(p)
-
-    _append_thresholds(
-        clauses,
-        params,
-        final_thresholds,
-        table_alias="v",
-        column_map=VIDEO_TOTAL_COLUMNS,
-    )
-    _append_thresholds(
-        clauses,
-        params,
-        snapshot_thresholds,
-        table_alias="sm",
-        column_map=SNAPSHOT_TOTAL_COLUMNS,
-    )
+            clauses.append(_SNAPSHOT_EXISTS_DATE_CLAUSE)
+            params.extend(_half_open_bounds(intent.date_range))
+
+    _append_thresholds(clauses, params, final_thresholds, clause_map=_FINAL_TOTAL_CLAUSES)
+    _append_thresholds(clauses, params, snapshot_thresholds, clause_map=_SNAPSHOT_AS_OF_CLAUSES)
 
     return from_sql, clauses, params, cte_sql
 
 
+def _intent_cache_key(intent: Intent) -> tuple[Any, ...]:
+    """Return a hashable view of every Intent field that influences the built query."""
+
+    date_range = intent.date_range
+    time_window = intent.time_window
+    return (
+        intent.operation,
+        intent.metric,
+        None
+        if date_range is None
+        else (date_range.scope, date_range.start_date, date_range.end_date),
+        None if time_window is None else (time_window.start_time, time_window.end_time),
+        intent.filters.creator_id,
+        tuple((t.applies_to, t.metric, t.op, t.value) for t in intent.filters.thresholds),
+    )
+
+
 def build_query(intent: Intent) -> tuple[str, tuple[Any, ...]]:
-    """Build a scalar SQL query + params from a validated Intent."""
-
-    builders = {
-        Operation.count_videos: _build_count_videos,
-        Operation.count_distinct_creators: _build_count_distinct_creators,
-        Operation.count_distinct_publish_days: _build_count_distinct_publish_days,
-        Operation.sum_total_metric: _build_sum_total_metric,
-        Operation.sum_delta_metric: _build_sum_delta_metric,
-        Operation.count_distinct_videos_with_positive_delta: _build_count_distinct_positive_delta,
-        Operation.count_snapshots_with_negative_delta: _build_count_snapshots_with_negative_delta,
-    }
+    """Build a scalar SQL query + params from a validated Intent.
+
+    Results are memoized per Intent content (bounded LRU), so repeated intents reuse the same SQL
+    string and params tuple.
+    """
 
+    key = _intent_cache_key(intent)
+    cached = _query_cache.get(key)
+    if cached is not None:
+        _query_cache.move_to_end(key)
+        return cached
+
+    built = _build_uncached(intent)
+    _query_cache[key] = built
+    if len(_query_cache) > _QUERY_CACHE_SIZE:
+        _query_cache.popitem(last=False)
+    return built
+
+
+def _build_uncached(intent: Intent) -> BuiltQuery:
     try:
-        built = builders[intent.operation](intent)
+        return _BUILDERS[intent.operation](intent)
     except KeyError as exc:
         raise SQLBuilderError(f"Unsupported operation: {intent.operation}") from exc
 
-    return built.sql, built.params
-
 
 def _build_count_videos(intent: Intent) -> BuiltQuery:
     if intent.metric is not None:
@@ -287,8 +295,8 @@ def _build_count_videos(intent: Intent) -> BuiltQuery:
 
     from_sql, clauses, params, cte_sql = _video_query_context(intent)
 
-    sql = f"{cte_sql}SELECT COUNT(*)::bigint {from_sql} {_where_and(clauses)}".strip()
-    return BuiltQuery(sql=sql, params=tuple(params))
+    sql = _assemble_sql(cte_sql, "SELECT COUNT(*)::bigint", from_sql, clauses)
+    return sql, tuple(params)
 
 
 def _build_count_distinct_creators(intent: Intent) -> BuiltQuery:
@@ -297,11 +305,8 @@ def _build_count_distinct_creators(intent: Intent) -> BuiltQuery:
 
     from_sql, clauses, params, cte_sql = _video_query_context(intent)
 
-    sql = (
-        f"{cte_sql}SELECT COUNT(DISTINCT v.creator_id)::bigint {from_sql} "
-        f"{_where_and(clauses)}"
-    ).strip()
-    return BuiltQuery(sql=sql, params=tuple(params))
+    sql = _assemble_sql(cte_sql, "SELECT COUNT(DISTINCT v.creator_id)::bigint", from_sql, clauses)
+    return sql, tuple(params)
 
 
 def _build_count_distinct_publish_days(intent: Intent) -> BuiltQuery:
@@ -312,11 +317,10 @@ def _build_count_distinct_publish_days(intent: Intent) -> BuiltQuery:
 
     from_sql, clauses, params, cte_sql = _video_query_context(intent)
 
-    sql = (
-        f"{cte_sql}SELECT COUNT(DISTINCT DATE(v.video_created_at))::bigint {from_sql} "
-        f"{_where_and(clauses)}"
-    ).strip()
-    return BuiltQuery(sql=sql, params=tuple(params))
+    sql = _assemble_sql(
+        cte_sql, "SELECT COUNT(DISTINCT DATE(v.video_created_at))::bigint", from_sql, clauses
+    )
+    return sql, tuple(params)
 
 
 def _build_sum_total_metric(intent: Intent) -> BuiltQuery:
@@ -327,11 +331,10 @@ def _build_sum_total_metric(intent: Intent) -> BuiltQuery:
 
     from_sql, clauses, params, cte_sql = _video_query_context(intent)
 
-    sql = (
-        f"{cte_sql}SELECT COALESCE(SUM(v.{metric_col}), 0)::bigint {from_sql} "
-        f"{_where_and(clauses)}"
-    ).strip()
-    return BuiltQuery(sql=sql, params=tuple(params))
+    sql = _assemble_sql(
+        cte_sql, f"SELECT COALESCE(SUM(v.{metric_col}), 0)::bigint", from_sql, clauses
+    )
+    return sql, tuple(params)
 
 
 def _build_sum_delta_metric(intent: Intent) -> BuiltQuery:
@@ -342,10 +345,10 @@ def _build_sum_delta_metric(intent: Intent) -> BuiltQuery:
 
     from_sql, clauses, params, cte_sql = _snapshot_query_context(intent)
 
-    sql = (
-        f"{cte_sql}SELECT COALESCE(SUM(s.{delta_col}), 0)::bigint {from_sql} {_where_and(clauses)}"
-    ).strip()
-    return BuiltQuery(sql=sql, params=tuple(params))
+    sql = _assemble_sql(
+        cte_sql, f"SELECT COALESCE(SUM(s.{delta_col}), 0)::bigint", from_sql, clauses
+    )
+    return sql, tuple(params)
 
 
 def _build_count_distinct_positive_delta(intent: Intent) -> BuiltQuery:
@@ -359,11 +362,8 @@ def _build_count_distinct_positive_delta(intent: Intent) -> BuiltQuery:
         initial_clauses=[f"s.{delta_col} > 0"],
     )
 
-    sql = (
-        f"{cte_sql}SELECT COUNT(DISTINCT s.video_id)::bigint {from_sql} "
-        f"{_where_and(clauses)}"
-    ).strip()
-    return BuiltQuery(sql=sql, params=tuple(params))
+    sql = _assemble_sql(cte_sql, "SELECT COUNT(DISTINCT s.video_id)::bigint", from_sql, clauses)
+    return sql, tuple(params)
 
 
 def _build_count_snapshots_with_negative_delta(intent: Intent) -> BuiltQuery:
@@ -377,5 +377,17 @@ def _build_count_snapshots_with_negative_delta(intent: Intent) -> BuiltQuery:
         initial_clauses=[f"s.{delta_col} < 0"],
     )
 
-    sql = f"{cte_sql}SELECT COUNT(*)::bigint {from_sql} {_where_and(clauses)}".strip()
-    return BuiltQuery(sql=sql, params=tuple(params))
+    sql = _assemble_sql(cte_sql, "SELECT COUNT(*)::bigint", from_sql, clauses)
+    return sql, tuple(params)
+
+
+# Operation dispatch table (defined after the builders it references).
+_BUILDERS: dict[Operation, Callable[[Intent], BuiltQuery]] = {
+    Operation.count_videos: _build_count_videos,
+    Operation.count_distinct_creators: _build_count_distinct_creators,
+    Operation.count_distinct_publish_days: _build_count_distinct_publish_days,
+    Operation.sum_total_metric: _build_sum_total_metric,
+    Operation.sum_delta_metric: _build_sum_delta_metric,
+    Operation.count_distinct_videos_with_positive_delta: _build_count_distinct_positive_delta,
+    Operation.count_snapshots_with_negative_delta: _build_count_snapshots_with_negative_delta,
+}
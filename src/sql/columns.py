@@ -8,19 +8,17 @@ from __future__ import annotations
 
 from src.intent.schema import Metric
 
-VIDEO_TOTAL_COLUMNS: dict[Metric, str] = {
+# `videos` and `video_snapshots` (and the `snap_max` CTE built from it) share the same total
+# column names, so both names refer to one mapping.
+_TOTAL_COLUMNS: dict[Metric, str] = {
     Metric.views: "views_count",
     Metric.likes: "likes_count",
     Metric.comments: "comments_count",
     Metric.reports: "reports_count",
 }
 
-SNAPSHOT_TOTAL_COLUMNS: dict[Metric, str] = {
-    Metric.views: "views_count",
-    Metric.likes: "likes_count",
-    Metric.comments: "comments_count",
-    Metric.reports: "reports_count",
-}
+VIDEO_TOTAL_COLUMNS = _TOTAL_COLUMNS
+SNAPSHOT_TOTAL_COLUMNS = _TOTAL_COLUMNS
 
 SNAPSHOT_DELTA_COLUMNS: dict[Metric, str] = {
     Metric.views: "delta_views_count",
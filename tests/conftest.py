@@ -7,8 +7,22 @@ can import from the `src.*` namespace when running `pytest` locally.
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 # Ensure `import src...` works when running pytest without installing the package.
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _clear_settings_cache() -> Iterator[None]:
+    """Keep `load_settings()` from leaking cached values between tests that change the env."""
+
+    from src.config.settings import load_settings
+
+    load_settings.cache_clear()
+    yield
+    load_settings.cache_clear()
@@ -6,18 +6,29 @@ The project contract requires that every incoming message results in exactly one
 
 from __future__ import annotations
 
+import asyncio
 import re
+import time
 from contextlib import asynccontextmanager
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
-from src.bot.handlers import handle_message
+from src.bot import handlers
+from src.bot.handlers import _sanitize_reply, handle_message
+from src.intent import parser as intent_parser
+from src.intent.llm_parser import LLMParserError
 
 _INTEGER_RE = re.compile(r"-?\d+")
 
 
+@pytest.fixture(autouse=True)
+def _clear_parse_cache() -> None:
+    handlers._parse_cache.clear()
+    handlers._inflight_parses.clear()
+
+
 class _FakeMessage:
     def __init__(self, text: str | None) -> None:
         self.text = text
@@ -28,13 +39,28 @@ class _FakeMessage:
         self.answers.append(text)
 
 
-def _make_app() -> Any:
+def _make_app(*, llm_enabled: bool = False) -> Any:
+    llm_api_key = "test-key" if llm_enabled else None
     return SimpleNamespace(
-        settings=SimpleNamespace(llm_enabled=False, llm_api_key=None),
+        settings=SimpleNamespace(llm_enabled=llm_enabled, llm_api_key=llm_api_key),
         pool=object(),
+        llm_enabled=llm_enabled,
+        llm_api_key=llm_api_key,
     )
 
 
+def _patch_db(monkeypatch: pytest.MonkeyPatch, value: int) -> None:
+    @asynccontextmanager
+    async def _fake_get_conn(_pool: Any):
+        yield object()
+
+    async def _fake_fetch_scalar_int(_conn: Any, _sql: str, _params: tuple[Any, ...] = ()) -> int:
+        return value
+
+    monkeypatch.setattr("src.bot.handlers.get_conn", _fake_get_conn)
+    monkeypatch.setattr("src.bot.handlers.fetch_scalar_int", _fake_fetch_scalar_int)
+
+
 def _assert_single_integer_reply(message: _FakeMessage) -> None:
     assert message.answers and len(message.answers) == 1
     assert _INTEGER_RE.fullmatch(message.answers[0]) is not None
@@ -78,22 +104,147 @@ async def test_handler_replies_digits_only_on_success(monkeypatch: pytest.Monkey
     app = _make_app()
     message = _FakeMessage(text="Сколько всего видео есть в системе?")
 
-    @asynccontextmanager
-    async def _fake_get_conn(_pool: Any):
-        yield object()
-
-    async def _fake_fetch_scalar_int(_conn: Any, _sql: str, _params: tuple[Any, ...] = ()) -> int:
-        return 123
-
     monkeypatch.setattr(
         "src.bot.handlers.parse_intent_with_source",
         lambda *_args, **_kwargs: SimpleNamespace(intent=object(), source="rules"),
     )
     monkeypatch.setattr("src.bot.handlers.build_query", lambda _intent: ("SELECT 1", ()))
-    monkeypatch.setattr("src.bot.handlers.get_conn", _fake_get_conn)
-    monkeypatch.setattr("src.bot.handlers.fetch_scalar_int", _fake_fetch_scalar_int)
+    _patch_db(monkeypatch, 123)
 
     await handle_message(message, app)  # type: ignore[arg-type]
 
     assert message.answers == ["123"]
     _assert_single_integer_reply(message)
+
+
+@pytest.mark.asyncio
+async def test_handler_reuses_parse_result_for_repeated_query(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = _make_app()
+    calls: list[str] = []
+
+    def _fake_parse(text: str, **_kwargs: Any) -> Any:
+        calls.append(text)
+        return SimpleNamespace(intent=object(), source="rules")
+
+    monkeypatch.setattr("src.bot.handlers.parse_intent_with_source", _fake_parse)
+    monkeypatch.setattr("src.bot.handlers.build_query", lambda _intent: ("SELECT 1", ()))
+    _patch_db(monkeypatch, 7)
+
+    first = _FakeMessage(text="Сколько всего видео?")
+    second = _FakeMessage(text="  сколько   ВСЕГО видео? ")
+    await handle_message(first, app)  # type: ignore[arg-type]
+    await handle_message(second, app)  # type: ignore[arg-type]
+
+    assert first.answers == ["7"]
+    assert second.answers == ["7"]
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("123", "123"), (" -7 ", "-7"), ("-", "0"), ("", "0"), ("1.5", "0"), ("²", "0")],
+)
+def test_sanitize_reply_keeps_only_ascii_integers(raw: str, expected: str) -> None:
+    assert _sanitize_reply(raw) == expected
+
+
+@pytest.mark.asyncio
+async def test_handler_does_not_cache_sub_day_relative_query(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = _make_app()
+    calls: list[str] = []
+
+    def _fake_parse(text: str, **_kwargs: Any) -> Any:
+        calls.append(text)
+        return SimpleNamespace(intent=object(), source="rules")
+
+    monkeypatch.setattr("src.bot.handlers.parse_intent_with_source", _fake_parse)
+    monkeypatch.setattr("src.bot.handlers.build_query", lambda _intent: ("SELECT 1", ()))
+    _patch_db(monkeypatch, 1)
+
+    for _ in range(2):
+        await handle_message(_FakeMessage(text="Сколько видео вышло час назад?"), app)  # type: ignore[arg-type]
+
+    # "час назад" resolves against the clock, not the UTC day, so it is parsed every time.
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_does_not_cache_rules_fallback_when_llm_enabled(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = _make_app(llm_enabled=True)
+    llm_calls: list[str] = []
+
+    def _fake_llm(text: str, **_kwargs: Any) -> dict[str, Any]:
+        llm_calls.append(text)
+        if len(llm_calls) == 1:
+            raise LLMParserError("timeout")
+        return {"operation": "count_videos"}
+
+    monkeypatch.setattr(intent_parser, "parse_intent_json_via_llm", _fake_llm)
+    _patch_db(monkeypatch, 5)
+
+    sources: list[str] = []
+    original_parse = handlers.parse_intent_with_source
+
+    def _recording_parse(*args: Any, **kwargs: Any) -> Any:
+        result = original_parse(*args, **kwargs)
+        sources.append(result.source)
+        return result
+
+    monkeypatch.setattr("src.bot.handlers.parse_intent_with_source", _recording_parse)
+
+    for _ in range(3):
+        message = _FakeMessage(text="Сколько всего видео есть в системе?")
+        await handle_message(message, app)  # type: ignore[arg-type]
+        assert message.answers == ["5"]
+
+    # First call falls back to rules (not cached), second reaches the LLM, third is a cache hit.
+    assert sources == ["rules", "llm"]
+    assert len(llm_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_shares_inflight_llm_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _make_app(llm_enabled=True)
+    calls: list[str] = []
+
+    def _slow_parse(text: str, **_kwargs: Any) -> Any:
+        calls.append(text)
+        time.sleep(0.05)
+        return SimpleNamespace(intent=object(), source="llm")
+
+    monkeypatch.setattr("src.bot.handlers.parse_intent_with_source", _slow_parse)
+    monkeypatch.setattr("src.bot.handlers.build_query", lambda _intent: ("SELECT 1", ()))
+    _patch_db(monkeypatch, 9)
+
+    messages = [_FakeMessage(text="Сколько всего видео?") for _ in range(3)]
+    await asyncio.gather(*(handle_message(m, app) for m in messages))  # type: ignore[arg-type]
+
+    assert [m.answers for m in messages] == [["9"]] * 3
+    assert len(calls) == 1
+    assert handlers._inflight_parses == {}
+
+
+@pytest.mark.asyncio
+async def test_handler_llm_cache_key_keeps_case(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _make_app(llm_enabled=True)
+    calls: list[str] = []
+
+    def _fake_parse(text: str, **_kwargs: Any) -> Any:
+        calls.append(text)
+        return SimpleNamespace(intent=object(), source="llm")
+
+    monkeypatch.setattr("src.bot.handlers.parse_intent_with_source", _fake_parse)
+    monkeypatch.setattr("src.bot.handlers.build_query", lambda _intent: ("SELECT 1", ()))
+    _patch_db(monkeypatch, 2)
+
+    # The LLM sees the raw text, so IDs differing only in case must not share a cache entry.
+    for text in ("Сколько видео у креатора AbC?", "Сколько видео у креатора abc?"):
+        await handle_message(_FakeMessage(text=text), app)  # type: ignore[arg-type]
+
+    assert calls == ["Сколько видео у креатора AbC?", "Сколько видео у креатора abc?"]
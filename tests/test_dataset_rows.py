@@ -0,0 +1,55 @@
+"""Tests for dataset-to-row conversion."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from src.db.dataset_rows import (
+    iter_snapshot_rows,
+    iter_video_rows,
+    video_row,
+    video_snapshot_rows,
+)
+
+
+def test_rows_coerce_ids_and_counters() -> None:
+    video = {
+        "id": 1,
+        "creator_id": "c01",
+        "video_created_at": "2025-11-01T10:00:00+00:00",
+        "views_count": Decimal("12.0"),
+        "likes_count": "3",
+        "comments_count": 0,
+        "reports_count": 0,
+        "created_at": "2025-11-01T10:00:00+00:00",
+        "updated_at": "2025-11-01T10:00:00+00:00",
+        "snapshots": [
+            {
+                "id": "s1",
+                "video_id": 1,
+                "views_count": 12.0,
+                "likes_count": 3,
+                "comments_count": 0,
+                "reports_count": 0,
+                "delta_views_count": "-2",
+                "delta_likes_count": 0,
+                "delta_comments_count": 0,
+                "delta_reports_count": 0,
+                "created_at": "2025-11-01T11:00:00+00:00",
+                "updated_at": "2025-11-01T11:00:00+00:00",
+            }
+        ],
+    }
+
+    row = video_row(video)
+    assert row[:2] == ("1", "c01")
+    assert row[3:7] == (12, 3, 0, 0)
+    assert all(type(v) is int for v in row[3:7])
+
+    (snapshot,) = video_snapshot_rows(video)
+    assert snapshot[:2] == ("s1", "1")
+    assert snapshot[2] == 12 and type(snapshot[2]) is int
+    assert snapshot[6] == -2
+
+    assert list(iter_video_rows([video])) == [row]
+    assert list(iter_snapshot_rows([video])) == [snapshot]
@@ -0,0 +1,52 @@
+"""Tests for DB connection helpers (no database required)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from psycopg.conninfo import conninfo_to_dict
+
+from src.db.connection import utc_conninfo
+from src.db.session import PREPARE_THRESHOLD, configure_connection
+
+
+def test_utc_conninfo_sets_timezone_option() -> None:
+    params = conninfo_to_dict(utc_conninfo("postgresql://u:p@localhost:5432/db"))
+    assert params["options"] == "-c TimeZone=UTC"
+    assert params["dbname"] == "db"
+    assert params["port"] == "5432"
+
+
+def test_utc_conninfo_preserves_existing_options() -> None:
+    url = "postgresql://u:p@localhost/db?options=-c%20search_path%3Dapp"
+    params = conninfo_to_dict(utc_conninfo(url))
+    assert params["options"] == "-c search_path=app -c TimeZone=UTC"
+
+
+class _FakeConnection:
+    def __init__(self, timezone: str) -> None:
+        self.info = SimpleNamespace(parameter_status=lambda _name: timezone)
+        self.autocommit = True
+        self.prepare_threshold: int | None = 5
+        self.executed: list[str] = []
+
+    async def execute(self, query: str, *_args: Any, **_kwargs: Any) -> None:
+        self.executed.append(query)
+
+
+@pytest.mark.asyncio
+async def test_configure_connection_skips_set_when_startup_option_applied() -> None:
+    conn = _FakeConnection("UTC")
+    await configure_connection(conn)  # type: ignore[arg-type]
+    assert conn.prepare_threshold == PREPARE_THRESHOLD
+    assert conn.executed == []
+
+
+@pytest.mark.asyncio
+async def test_configure_connection_sets_utc_when_startup_option_dropped() -> None:
+    conn = _FakeConnection("Europe/Moscow")
+    await configure_connection(conn)  # type: ignore[arg-type]
+    assert len(conn.executed) == 1
+    assert "TimeZone" in conn.executed[0]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import UTC, date
+from datetime import UTC, date, datetime, timedelta
 
+from src.intent import dates
 from src.intent.dates import inclusive_dates_to_half_open, parse_date_range
 
 
@@ -37,3 +38,23 @@ def test_parse_month_range_genitive_ru() -> None:
     start, end = parse_date_range("ноября 2025 года")
     assert start == date(2025, 11, 1)
     assert end == date(2025, 11, 30)
+
+
+def test_parse_relative_day_uses_current_utc_day() -> None:
+    yesterday = datetime.now(UTC).date() - timedelta(days=1)
+    assert parse_date_range("вчера") == (yesterday, yesterday)
+    # Served from the per-day cache on repeat.
+    assert parse_date_range(" Вчера ") == (yesterday, yesterday)
+
+
+def test_sub_day_relative_phrase_bypasses_day_cache() -> None:
+    assert dates.has_sub_day_relative_phrase("час назад")
+    assert not dates.has_sub_day_relative_phrase("вчера")
+
+    dates._parse_date_range_for_day.cache_clear()
+    parse_date_range("час назад")
+    assert dates._parse_date_range_for_day.cache_info().currsize == 0
+
+
+def test_parse_returns_none_without_date() -> None:
+    assert parse_date_range("сколько всего видео есть в системе") is None
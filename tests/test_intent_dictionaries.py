@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from src.intent.dictionaries import (
+    classify_metric_tokens,
     detect_comparator,
     detect_single_metric,
     has_ambiguous_metric_term,
+    tokenize,
 )
 from src.intent.schema import Metric
 
@@ -29,3 +31,16 @@ def test_ambiguous_metric_is_detected() -> None:
     assert has_ambiguous_metric_term("сколько реакции")
     assert has_ambiguous_metric_term("сколько реакций")
     assert has_ambiguous_metric_term("сколько реакции и просмотры")  # still ambiguous in MVP
+
+
+def test_classify_metric_tokens_single_pass() -> None:
+    assert classify_metric_tokens(tokenize("сколько просмотров")) == (False, Metric.views)
+    assert classify_metric_tokens(tokenize("просмотров и лайков")) == (False, None)
+    assert classify_metric_tokens(tokenize("реакции и просмотры")) == (True, None)
+
+
+def test_comparator_prefers_longest_phrase() -> None:
+    # "меньше чем" (10 chars) outranks the overlapping "не меньше" (9 chars).
+    assert detect_comparator("не меньше чем 10") == "<"
+    assert detect_comparator("больше 10 просмотров не менее 5 лайков") == ">="
+    assert detect_comparator("сколько всего видео") is None
@@ -0,0 +1,65 @@
+"""Tests for the optional LLM intent parser transport (no network)."""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+from urllib.error import HTTPError
+
+import pytest
+
+from src.intent import llm_parser
+from src.intent.llm_parser import LLMConfig, LLMParserError, parse_intent_json_via_llm
+
+
+class _FakeResponse(io.BytesIO):
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+def _completion(content: str) -> _FakeResponse:
+    body = {"choices": [{"message": {"content": content}}]}
+    return _FakeResponse(json.dumps(body).encode())
+
+
+def _http_error(code: int) -> HTTPError:
+    return HTTPError("https://llm.invalid", code, "error", {}, None)  # type: ignore[arg-type]
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm_parser.time, "sleep", lambda _s: None)
+
+
+def test_llm_call_retries_transient_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    outcomes: list[Any] = [_http_error(503), _completion('{"operation": "count_videos"}')]
+
+    def _fake_urlopen(_req: Any, timeout: float) -> Any:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(llm_parser, "urlopen", _fake_urlopen)
+
+    result = parse_intent_json_via_llm("x", config=LLMConfig(api_key="k", max_retries=1))
+    assert result == {"operation": "count_videos"}
+    assert outcomes == []
+
+
+def test_llm_call_does_not_retry_client_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    def _fake_urlopen(_req: Any, timeout: float) -> Any:
+        calls.append(1)
+        raise _http_error(401)
+
+    monkeypatch.setattr(llm_parser, "urlopen", _fake_urlopen)
+
+    with pytest.raises(LLMParserError):
+        parse_intent_json_via_llm("x", config=LLMConfig(api_key="k", max_retries=3))
+    assert len(calls) == 1
@@ -0,0 +1,98 @@
+"""Tests for the dataset loader's transaction flow (no database)."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.db import load_json
+
+
+class _FakeCopy:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+
+    def write_row(self, row: tuple[Any, ...]) -> None:
+        self.rows.append(row)
+
+
+class _FakeCursor:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+        self.copied: dict[str, list[tuple[Any, ...]]] = {}
+
+    def __enter__(self) -> _FakeCursor:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def execute(self, query: str, *_args: Any, **_kwargs: Any) -> None:
+        self.executed.append(query)
+
+    @contextmanager
+    def copy(self, query: str):
+        yield _FakeCopy(self.copied.setdefault(query, []))
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.cursor_obj = _FakeCursor()
+        self.committed = False
+
+    def __enter__(self) -> _FakeConnection:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    @contextmanager
+    def transaction(self):
+        yield
+        self.committed = True
+
+    def cursor(self) -> _FakeCursor:
+        return self.cursor_obj
+
+
+@pytest.fixture()
+def fake_conn(monkeypatch: pytest.MonkeyPatch) -> _FakeConnection:
+    conn = _FakeConnection()
+    monkeypatch.setattr(load_json, "load_dotenv", lambda *_args: None)
+    monkeypatch.setattr(load_json, "require_database_url", lambda: "postgresql://unused")
+    monkeypatch.setattr(load_json, "connect_utc", lambda _url: conn)
+    return conn
+
+
+def test_empty_videos_list_is_a_noop(tmp_path: Path, fake_conn: _FakeConnection) -> None:
+    dataset = tmp_path / "videos.json"
+    dataset.write_text('{"videos": []}', encoding="utf-8")
+
+    load_json.load_dataset(path=str(dataset), url=None, truncate=True)
+
+    cur = fake_conn.cursor_obj
+    # The requested TRUNCATE still commits; nothing is copied into or upserted from `videos`.
+    assert fake_conn.committed
+    assert cur.executed[0] == "TRUNCATE video_snapshots, videos"
+    assert load_json._COPY_VIDEOS_SQL not in cur.copied
+    assert load_json._UPSERT_VIDEOS_SQL not in cur.executed
+    assert load_json._UPSERT_SNAPSHOTS_SQL not in cur.executed
+
+
+@pytest.mark.parametrize(
+    "payload",
+    ['[{"id": "v1"}]', '{"items": []}', '{"videos": {"id": "v1"}}', '{"videos": null}'],
+)
+def test_unexpected_format_raises_before_truncate(
+    tmp_path: Path, fake_conn: _FakeConnection, payload: str
+) -> None:
+    dataset = tmp_path / "videos.json"
+    dataset.write_text(payload, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unexpected dataset format"):
+        load_json.load_dataset(path=str(dataset), url=None, truncate=True)
+
+    assert fake_conn.cursor_obj.executed == []
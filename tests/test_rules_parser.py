@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from src.intent import rules_parser
 from src.intent.rules_parser import RulesParserError, parse_intent
 from src.intent.schema import (
     DateRangeScope,
@@ -44,7 +45,7 @@ def test_parse_total_videos() -> None:
     assert intent.metric is None
     assert intent.date_range is None
     assert intent.filters.creator_id is None
-    assert intent.filters.thresholds == []
+    assert intent.filters.thresholds == ()
 
 
 def test_parse_creator_and_inclusive_range() -> None:
@@ -73,6 +74,11 @@ def test_parse_sum_delta_metric_on_day() -> None:
     _assert_views_delta_growth_on_2025_11_28(intent)
 
 
+def test_parse_multiline_query() -> None:
+    intent = parse_intent("На сколько просмотров\nв сумме выросли все видео\n28 ноября 2025?")
+    _assert_views_delta_growth_on_2025_11_28(intent)
+
+
 def test_parse_sum_delta_metric_with_time_window() -> None:
     creator_id = "cd87be38b50b4fdd8342bb3c383f3c7d"
     intent = parse_intent(
@@ -98,6 +104,16 @@ def test_parse_sum_total_metric_for_month_published() -> None:
     assert intent.date_range.end_date.isoformat() == "2025-06-30"
 
 
+def test_parse_thresholds_in_both_word_orders() -> None:
+    intent = parse_intent(
+        "Сколько видео набрало больше 10 просмотров и лайков больше 5 за всё время?"
+    )
+    assert [(t.metric, t.op, t.value) for t in intent.filters.thresholds] == [
+        (Metric.views, ">", 10),
+        (Metric.likes, ">", 5),
+    ]
+
+
 def test_parse_distinct_videos_positive_delta() -> None:
     intent = parse_intent("Сколько разных видео получали новые просмотры 27 ноября 2025?")
     assert intent.operation == Operation.count_distinct_videos_with_positive_delta
@@ -146,3 +162,20 @@ def test_parse_count_distinct_publish_days_in_month_for_creator() -> None:
 def test_reactions_is_unsupported() -> None:
     with pytest.raises(RulesParserError):
         parse_intent("Сколько реакций было 28 ноября 2025?")
+
+
+def test_parse_intent_is_memoized_per_text() -> None:
+    text = "Сколько видео набрало больше 100 000 просмотров за всё время?"
+    assert parse_intent(text) is parse_intent(text)
+    assert parse_intent(f"  {text.upper()}\n") is parse_intent(text)
+
+    # Failures are not cached and keep raising.
+    for _ in range(2):
+        with pytest.raises(RulesParserError):
+            parse_intent("Сколько реакций было 28 ноября 2025?")
+
+
+def test_parse_intent_does_not_memoize_sub_day_relative_phrase() -> None:
+    rules_parser._parse_intent_for_day.cache_clear()
+    parse_intent("Сколько видео вышло час назад?")
+    assert rules_parser._parse_intent_for_day.cache_info().currsize == 0
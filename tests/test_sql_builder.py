@@ -272,3 +272,28 @@ def test_build_count_snapshots_with_negative_delta_shape() -> None:
     assert "s.delta_views_count < 0" in sql
     assert params == ()
     assert _placeholder_count(sql) == len(params)
+
+
+def test_build_query_is_memoized_per_intent_content() -> None:
+    def _intent(value: int) -> Intent:
+        return Intent(
+            operation=Operation.count_videos,
+            metric=None,
+            filters=Filters(
+                thresholds=[
+                    Threshold(
+                        applies_to=ThresholdAppliesTo.final_total,
+                        metric=Metric.views,
+                        op=">",
+                        value=value,
+                    )
+                ]
+            ),
+        )
+
+    first = build_query(_intent(42))
+    assert build_query(_intent(42)) is first
+
+    other = build_query(_intent(43))
+    assert other[0] == first[0]
+    assert other[1] == (43,)